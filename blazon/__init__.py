@@ -2,6 +2,15 @@ from .helpers import ValidationError, ConstraintFailure
 from .environment import native, Undefined
 from .schematic import Schematic, field
 
-from .environments import json
-
 schema = native.schema
+
+
+def __getattr__(name):
+    # Environments other than native are built the first time they're asked for, e.g. `blazon.json`
+    # or `from blazon import json`, so programs that don't use them don't pay for them on import.
+    if name == "json":
+        from .environments import json
+
+        globals()["json"] = json
+        return json
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
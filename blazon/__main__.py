@@ -0,0 +1,121 @@
+"""
+  Command line validator, so a drop of data can be checked against a schema before it's loaded:
+
+    python -m blazon validate --schema user.yaml users.ndjson > users.clean.ndjson
+
+  Records are streamed, a top-level JSON array or NDJSON, or YAML documents. The converted records
+  are written out as NDJSON, and a line for each record that fails is written to stderr. At the end
+  it prints how many records it got through a second and the p50/p99 latency per record. Exits 1 if
+  any record failed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+from .streaming import iter_json, check_items, StreamError, CHUNK_SIZE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m blazon", description="Validates data files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate", help="validate records against a schema")
+    validate.add_argument(
+        "files", nargs="+", help="data files, JSON, NDJSON or YAML, or - for stdin"
+    )
+    validate.add_argument("--schema", "-s", required=True, help="the schema, a JSON or YAML file")
+    validate.add_argument("--output", "-o", help="where to write the records, default stdout")
+    validate.add_argument("--quiet", "-q", action="store_true", help="don't write out the records")
+    validate.add_argument(
+        "--no-convert", dest="convert", action="store_false", help="validate without converting"
+    )
+    validate.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+    try:
+        return run_validate(args)
+    except (OSError, ValueError) as err:
+        # Can't read the schema or a file, or a JSON array is broken past the point of recovery.
+        print(f"{parser.prog}: error: {err}", file=sys.stderr)
+        return 2
+
+
+def run_validate(args):
+    from .environments import json as env
+
+    schema = env.from_file(args.schema)
+
+    output = None
+    if not args.quiet:
+        output = open(args.output, "w") if args.output else sys.stdout
+
+    latencies = []
+    failed = 0
+    started = time.perf_counter()
+    try:
+        for filename in args.files:
+            results = check_items(schema, read_records(filename, args.chunk_size), args.convert)
+            while True:
+                t = time.perf_counter()
+                try:
+                    result = next(results)
+                except StopIteration:
+                    break
+                latencies.append(time.perf_counter() - t)
+
+                if isinstance(result, StreamError):
+                    failed += 1
+                    error = {"file": filename, "index": result.index, "error": str(result.error)}
+                    print(json.dumps(error), file=sys.stderr)
+                elif output is not None:
+                    output.write(json.dumps(result, default=str) + "\n")
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print(summary(len(latencies), failed, elapsed, latencies), file=sys.stderr)
+    return 1 if failed else 0
+
+
+def read_records(filename, chunk_size=CHUNK_SIZE):
+    """Yields the records in the file, read as YAML documents if it's named like YAML."""
+    if os.path.splitext(filename)[1] not in (".yaml", ".yml"):
+        source = sys.stdin.buffer if filename == "-" else filename
+        return iter_json(source, chunk_size)
+    return read_yaml(filename)
+
+
+def read_yaml(filename):
+    import yaml
+
+    with open(filename) as file:
+        for document in yaml.safe_load_all(file):
+            if isinstance(document, list):
+                yield from document
+            elif document is not None:
+                yield document
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of already sorted values."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def summary(total, failed, elapsed, latencies):
+    latencies = sorted(latencies)
+    rate = total / elapsed if elapsed else 0.0
+    return (
+        f"{total} records, {total - failed} valid, {failed} failed in {elapsed:.2f}s"
+        f" -- {rate:,.0f} records/s, p50 {percentile(latencies, 50) * 1e6:.1f}µs"
+        f", p99 {percentile(latencies, 99) * 1e6:.1f}µs"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
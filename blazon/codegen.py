@@ -0,0 +1,319 @@
+"""
+  Turns a compiled Schema into generated Python source, one function per mode, so that the common
+  constraints run inline instead of as a chain of closures that are each wrapped in a try/except.
+
+  Constraints the generator doesn't know about are still called through their handlers. Whenever
+  the generated code can't finish, it hands the instance back to the regular constraint loop, so
+  errors look exactly the same as they would without code generation.
+"""
+
+from itertools import count
+from collections.abc import Sequence
+from .helpers import Undefined
+from .schema import handler_check
+from .constraints import base, numbers, strings, containers, conditionals, maps
+
+### How deep we inline nested schemas before we just call them.
+MAX_INLINE_DEPTH = 8
+
+
+class GeneratedSchema:
+    """
+    The generated functions for a schema:
+
+        convert(instance, partial=False) -> converted instance, raises like Schema.__call__
+        validate(instance, partial=False) -> bool
+    """
+
+    def __init__(self, schema, source, convert, validate):
+        self.schema = schema
+        self.source = source
+        self.convert = convert
+        self.validate = validate
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.schema!r})"
+
+
+class GenerationFailed(Exception):
+    """Raised by generated conversion code to fall back to the regular constraint loop"""
+
+
+def generate(schema) -> GeneratedSchema:
+    """Generates the conversion and validation functions for the given compiled schema."""
+    generator = CodeGenerator(schema)
+    source = "\n\n".join(
+        [generator.function("convert", "convert"), generator.function("validate", "validate")]
+    )
+    code = compile(source, f"<blazon {schema!r}>", "exec")
+    namespace = dict(generator.namespace)
+    exec(code, namespace)
+    return GeneratedSchema(schema, source, namespace["convert"], namespace["validate"])
+
+
+class CodeGenerator:
+    def __init__(self, schema):
+        self.schema = schema
+        self.names = count()
+        self.namespace = {
+            "_schema": schema,
+            "_missing": object(),
+            "_failed": GenerationFailed(),
+            "_Sequence": Sequence,
+        }
+        self.lines = []
+        self.stack = []
+        self.mode = None
+
+    ### Source Helpers ###
+    def constant(self, value, prefix="k"):
+        name = f"_{prefix}{next(self.names)}"
+        self.namespace[name] = value
+        return name
+
+    def variable(self):
+        return f"x{next(self.names)}"
+
+    def line(self, depth, text):
+        self.lines.append("    " * depth + text)
+
+    def fail(self):
+        if self.mode == "convert":
+            return "raise _failed"
+        return "return False"
+
+    def block(self, depth, start):
+        """Makes sure the block started at line index `start` isn't empty."""
+        if len(self.lines) == start:
+            self.line(depth, "pass")
+
+    ### Functions ###
+    def function(self, name, mode):
+        self.mode = mode
+        self.lines = [f"def {name}(instance, partial=False):", "    try:", "        x = instance"]
+        self.schema_body(self.schema, "x", 2, "partial")
+        if mode == "convert":
+            self.line(2, "return x")
+            self.line(1, "except Exception:")
+            self.line(2, "pass")
+            self.line(1, "return _schema._convert(instance, partial)")
+        else:
+            self.line(2, "return True")
+            self.line(1, "except Exception:")
+            self.line(2, "pass")
+            self.line(1, "return bool(_schema._validate(instance, partial))")
+        return "\n".join(self.lines)
+
+    def schema_body(self, schema, var, depth, partial):
+        for key, handler in schema.constraints.items():
+            constraint = schema.env.get_constraint(key)
+            emitter = emitters.get(constraint.compiler)
+
+            # The schema wraps handlers with an applicability check when it doesn't know the type,
+            # we do the same check inline.
+            guarded = schema.type is Undefined and (constraint.require or constraint.exclude)
+            inner = depth
+            if guarded:
+                handler = getattr(handler, "__wrapped__", handler)
+                checks = []
+                if constraint.require:
+                    checks.append(f"isinstance({var}, {self.constant(constraint.require, 't')})")
+                if constraint.exclude:
+                    exclude = self.constant(constraint.exclude, "t")
+                    checks.append(f"not isinstance({var}, {exclude})")
+                self.line(depth, f"if {' and '.join(checks)}:")
+                inner = depth + 1
+
+            start = len(self.lines)
+            if emitter:
+                emitter(self, schema, schema.value[key], handler, var, inner, partial)
+            else:
+                self.call_handler(handler, var, inner, partial)
+            self.block(inner, start)
+
+            if guarded and schema.strict:
+                self.line(depth, "else:")
+                self.line(depth + 1, self.fail())
+
+    def subschema(self, sub, var, depth, partial):
+        """Inlines the given subschema, or calls it if it's recursive, lazy, or we are too deep."""
+        if (
+            not sub.compiled
+            or len(self.stack) >= MAX_INLINE_DEPTH
+            or any(s is sub for s in self.stack)
+        ):
+            name = self.constant(sub, "schema")
+            if self.mode == "convert":
+                self.line(depth, f"{var} = {name}({var}, {partial})")
+            else:
+                self.line(depth, f"if not {name}.is_valid({var}, {partial}):")
+                self.line(depth + 1, self.fail())
+            return
+        self.stack.append(sub)
+        self.schema_body(sub, var, depth, partial)
+        self.stack.pop()
+
+    def call_handler(self, handler, var, depth, partial):
+        if self.mode == "convert":
+            name = self.constant(handler, "handler")
+            self.line(depth, f"{var} = {name}({var}, convert=True, partial={partial})")
+        else:
+            # A handler unwrapped from its applicability check may not have one, e.g. from a
+            # constraint the user registered, so we run it the way Schema.compile() would.
+            check = getattr(handler, "is_valid", None) or handler_check(handler)
+            name = self.constant(check, "check")
+            self.line(depth, f"if not {name}({var}, {partial}):")
+            self.line(depth + 1, self.fail())
+
+
+### Emitters ###
+def emit_type(gen, schema, value, handler, var, depth, partial):
+    t = gen.constant(schema.type, "type")
+    if gen.mode == "convert":
+        gen.line(depth, f"if not isinstance({var}, {t}):")
+        gen.line(depth + 1, f"{var} = {t}({var})")
+    else:
+        gen.line(depth, f"if not isinstance({var}, {t}):")
+        gen.line(depth + 1, gen.fail())
+
+
+def emit_enum(gen, schema, value, handler, var, depth, partial):
+    choices = gen.constant(frozenset(value), "choices")
+    gen.line(depth, f"if {var} not in {choices}:")
+    gen.line(depth + 1, gen.fail())
+
+
+def emit_const(gen, schema, value, handler, var, depth, partial):
+    const = gen.constant(value, "const")
+    if gen.mode == "convert":
+        gen.line(depth, f"{var} = {const}")
+    else:
+        gen.line(depth, f"if {var} != {const}:")
+        gen.line(depth + 1, gen.fail())
+
+
+def bound_emitter(exclusive_key, inclusive_op, exclusive_op):
+    def emit(gen, schema, value, handler, var, depth, partial):
+        bound = gen.constant(value, "bound")
+        if schema.get(exclusive_key, False):
+            gen.line(depth, f"if not {var} {exclusive_op} {bound}:")
+            gen.line(depth + 1, gen.fail())
+        else:
+            gen.line(depth, f"if not {var} {inclusive_op} {bound}:")
+            if gen.mode == "convert":
+                gen.line(depth + 1, f"{var} = {bound}")
+            else:
+                gen.line(depth + 1, gen.fail())
+
+    return emit
+
+
+def emit_multiple_of(gen, schema, value, handler, var, depth, partial):
+    gen.line(depth, f"if {var} % {gen.constant(value, 'multiple')} != 0:")
+    gen.line(depth + 1, gen.fail())
+
+
+def emit_max_length(gen, schema, value, handler, var, depth, partial):
+    size = gen.constant(value, "size")
+    if gen.mode == "convert":
+        gen.line(depth, f"{var} = {var}[:{size}]")
+    else:
+        gen.line(depth, f"if len({var}) > {size}:")
+        gen.line(depth + 1, gen.fail())
+
+
+def emit_min_length(gen, schema, value, handler, var, depth, partial):
+    gen.line(depth, f"if len({var}) < {gen.constant(value, 'size')}:")
+    gen.line(depth + 1, gen.fail())
+
+
+def emit_pattern(gen, schema, value, handler, var, depth, partial):
+    search = gen.constant(handler.regex.search, "search")
+    gen.line(depth, f"if {search}({var}) is None:")
+    gen.line(depth + 1, gen.fail())
+
+
+def emit_max_items(gen, schema, value, handler, var, depth, partial):
+    size = gen.constant(value, "size")
+    if gen.mode == "convert":
+        gen.line(depth, f"if isinstance({var}, _Sequence):")
+        gen.line(depth + 1, f"{var} = {var}[:{size}]")
+        gen.line(depth, f"elif len({var}) > {size}:")
+        gen.line(depth + 1, gen.fail())
+    else:
+        gen.line(depth, f"if len({var}) > {size}:")
+        gen.line(depth + 1, gen.fail())
+
+
+def emit_required(gen, schema, value, handler, var, depth, partial):
+    if not value:
+        return
+    if partial != "False":
+        gen.line(depth, f"if not {partial}:")
+        depth += 1
+    checks = " or ".join(f"{gen.constant(key, 'key')} not in {var}" for key in value)
+    gen.line(depth, f"if {checks}:")
+    gen.line(depth + 1, gen.fail())
+
+
+def emit_entries(gen, schema, value, handler, var, depth, partial):
+    for name, sub in handler.schema_map.items():
+        key = gen.constant(name, "key")
+        v = gen.variable()
+        gen.line(depth, f"{v} = {var}.get({key}, _missing)")
+        gen.line(depth, f"if {v} is not _missing:")
+        start = len(gen.lines)
+        if gen.mode == "convert":
+            gen.line(depth + 1, f"if hasattr({v}, '__schema__'):")
+            gen.line(depth + 2, f"{v} = {v}.get_raw_value()")
+            gen.subschema(sub, v, depth + 1, "False")
+            gen.line(depth + 1, f"{var}[{key}] = {v}")
+        else:
+            gen.subschema(sub, v, depth + 1, "False")
+        gen.block(depth + 1, start)
+
+
+def emit_items(gen, schema, value, handler, var, depth, partial):
+    sub = handler.additional_items
+    if handler.schemas_to_match or not sub or handler.vector:
+        # Tuple-style items have enough edge cases that we leave them to the handler, as we do
+        # items that might be vectorized.
+        return gen.call_handler(handler, var, depth, partial)
+
+    v = gen.variable()
+    if gen.mode == "convert":
+        results = gen.variable()
+        gen.line(depth, f"{results} = []")
+        gen.line(depth, f"for {v} in {var}:")
+        gen.subschema(sub, v, depth + 1, "False")
+        gen.line(depth + 1, f"{results}.append({v})")
+        gen.line(depth, f"{var} = {results}")
+    else:
+        gen.line(depth, f"for {v} in {var}:")
+        start = len(gen.lines)
+        gen.subschema(sub, v, depth + 1, "False")
+        gen.block(depth + 1, start)
+
+
+def emit_all_of(gen, schema, value, handler, var, depth, partial):
+    for sub in handler.subschemas:
+        gen.subschema(sub, var, depth, partial)
+
+
+emitters = {
+    base.type_constraint: emit_type,
+    base.enum: emit_enum,
+    base.const: emit_const,
+    numbers.maximum: bound_emitter("exclusive_maximum", "<=", "<"),
+    numbers.minimum: bound_emitter("exclusive_minimum", ">=", ">"),
+    numbers.multiple_of: emit_multiple_of,
+    strings.max_length: emit_max_length,
+    strings.min_length: emit_min_length,
+    strings.pattern: emit_pattern,
+    containers.max_items: emit_max_items,
+    containers.min_items: emit_min_length,
+    containers.items: emit_items,
+    maps.required: emit_required,
+    maps.entries: emit_entries,
+    conditionals.all_of: emit_all_of,
+}
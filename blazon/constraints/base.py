@@ -1,9 +1,11 @@
-from inflection import underscore
 from functools import wraps
 from dataclasses import dataclass, field
 from typing import Callable, Type, List, Mapping
 
 from ..helpers import (
+    underscore,
+    memoize_inflection,
+    picklable_inflection,
     Undefined,
     hashish,
     identity,
@@ -11,6 +13,9 @@ from ..helpers import (
     ConstraintFailure,
     ValidationError,
     ConstraintNotApplicable,
+    array_types,
+    numeric_array,
+    column_values,
 )
 
 
@@ -44,9 +49,13 @@ class Constraint:
 class ConstraintRegistry:
     def __init__(self, inflection=underscore, registry=None, aliases=None):
         self.registry = registry or {}
-        self.inflection = inflection
+        self.inflection = memoize_inflection(inflection)
         self.aliases = aliases or {}
 
+    def __reduce__(self):
+        inflection = picklable_inflection(self.inflection)
+        return self.__class__, (inflection, self.registry, self.aliases)
+
     def add(
         self,
         compiler: Callable,
@@ -77,6 +86,7 @@ class ConstraintRegistry:
     def clone(
         self, *, include: List[str] = None, map: Mapping[str, str] = {}, inflection=underscore
     ):
+        inflection = memoize_inflection(inflection)
         new_registry = {}
         if include is None:
             include = self.registry.keys()
@@ -126,6 +136,18 @@ def type_constraint(schema, value):
 
         raise ValidationError
 
+    def is_valid(instance, partial=False):
+        return isinstance(instance, value)
+
+    def batch(values, partial=False):
+        arr = numeric_array(values)
+        if arr is not None:
+            return [issubclass(array_types[arr.dtype.kind], value)] * len(arr)
+        return [isinstance(v, value) for v in values]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
+
     # Special case for the type constructor, we also return the expected type.
     return handler, value
 
@@ -139,6 +161,14 @@ def enum(schema, value):
             raise ValidationError
         return instance
 
+    def is_valid(instance, partial=False):
+        return instance in choices
+
+    def batch(values, partial=False):
+        return [v in choices for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
@@ -150,6 +180,14 @@ def const(schema, value):
                 raise ValidationError
         return value
 
+    def is_valid(instance, partial=False):
+        return instance == value
+
+    def batch(values, partial=False):
+        return [v == value for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
@@ -9,10 +9,10 @@ from .containers import min_items, max_items
     description="If the 'if' schema validates then the 'then' schema must also, otherwise the 'else' schema must",
 )
 def if_condition(schema, value):
-    _if = schema.env.schema(value)
+    _if = schema.env.subschema(value)
     subschema = {
-        "then": schema.env.schema(schema.get("then", None)),
-        "else": schema.env.schema(schema.get("else", None)),
+        "then": schema.env.subschema(schema.get("then", None)),
+        "else": schema.env.subschema(schema.get("else", None)),
     }
 
     def handler(instance, convert=False, partial=False):
@@ -35,6 +35,14 @@ def if_condition(schema, value):
             e.path = [branch] + e.path
             raise
 
+    def is_valid(instance, partial=False):
+        if _if.is_valid(instance):
+            branch = subschema["then"]
+        else:
+            branch = subschema["else"]
+        return branch is None or branch.is_valid(instance, partial=partial)
+
+    handler.is_valid = is_valid
     return handler
 
 
@@ -50,7 +58,7 @@ def else_conditional(schema, value):
 
 @register(description="All of the given schemas need to validate", require=[Iterable])
 def all_of(schema, value):
-    subschemas = tuple(schema.env.schema(v) for v in value)
+    subschemas = tuple(schema.env.subschema(v) for v in value)
 
     def handler(instance, convert=False, partial=False):
         if convert:
@@ -67,12 +75,20 @@ def all_of(schema, value):
 
         return instance
 
+    def is_valid(instance, partial=False):
+        for sub in subschemas:
+            if not sub.is_valid(instance, partial=partial):
+                return False
+        return True
+
+    handler.is_valid = is_valid
+    handler.subschemas = subschemas
     return handler
 
 
 @register(description="Any of the given schemas need to validate")
 def any_of(schema, value):
-    subschemas = tuple(schema.env.schema(v) for v in value)
+    subschemas = tuple(schema.env.subschema(v) for v in value)
 
     def handler(instance, convert=False, partial=False):
         if convert:
@@ -96,12 +112,19 @@ def any_of(schema, value):
 
         return instance
 
+    def is_valid(instance, partial=False):
+        for sub in subschemas:
+            if sub.is_valid(instance, partial=partial):
+                return True
+        return False
+
+    handler.is_valid = is_valid
     return handler
 
 
 @register(description="Any of the given schemas need to validate")
 def any_of(schema, value):
-    subschemas = tuple(schema.env.schema(v) for v in value)
+    subschemas = tuple(schema.env.subschema(v) for v in value)
 
     def handler(instance, convert=False, partial=False):
         if convert:
@@ -125,38 +148,60 @@ def any_of(schema, value):
 
         return instance
 
+    def is_valid(instance, partial=False):
+        for sub in subschemas:
+            if sub.is_valid(instance, partial=partial):
+                return True
+        return False
+
+    handler.is_valid = is_valid
     return handler
 
 
 @register(description="Exactly one of the given schemas needs to validate, no more, no less")
 def one_of(schema, value):
-    subschemas = tuple(schema.env.schema(v) for v in value)
+    subschemas = tuple(schema.env.subschema(v) for v in value)
 
     def handler(instance, convert=False, partial=False):
-        success = set()
+        # Matches are counted by branch, equal branches can be the same shared Schema.
+        success = []
         errors = {}
         for index, sub in enumerate(subschemas):
             result = sub.validate(instance, partial=partial)
             if not result:
                 errors[f"oneof({index})"] = result
             else:
-                success.add(sub)
+                success.append(sub)
         if len(success) != 1:
             raise ConstraintFailure(sub_errors=errors)
         if convert:
-            return success.pop()(instance, partial=partial)
+            return success[0](instance, partial=partial)
         return instance
 
+    def is_valid(instance, partial=False):
+        matched = False
+        for sub in subschemas:
+            if sub.is_valid(instance, partial=partial):
+                if matched:
+                    return False
+                matched = True
+        return matched
+
+    handler.is_valid = is_valid
     return handler
 
 
 @register(name="not", description="Must *not* validate against the subschema")
 def not_(schema, value):
-    condition = schema.env.schema(value)
+    condition = schema.env.subschema(value)
 
     def handler(instance, convert=False, partial=False):
         if condition.validate(instance, partial=partial):
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return not condition.is_valid(instance, partial=partial)
+
+    handler.is_valid = is_valid
     return handler
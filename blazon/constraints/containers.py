@@ -3,6 +3,7 @@ from typing import Callable, Set, Any
 from numbers import Number
 from collections.abc import Iterable, Mapping, Sized, Sequence
 from .base import Constraint, ConstraintFailure, register, Undefined
+from .vectors import NumericItems
 
 
 def matches(left, right, fill=Undefined):
@@ -36,14 +37,25 @@ def schema_matches(instance, schemas, fill=Undefined, convert=False):
 def items(schema, value):
     if isinstance(value, Mapping):
         schemas_to_match = []
-        additional_items = schema.env.schema(value)
+        additional_items = schema.env.subschema(value)
     else:
-        schemas_to_match = [schema.env.schema(v) for v in value]
+        schemas_to_match = [schema.env.subschema(v) for v in value]
         additional_items = schema.get("additional_items", Undefined)
         if additional_items is not Undefined and additional_items is not False:
-            additional_items = schema.env.schema(additional_items)
+            additional_items = schema.env.subschema(additional_items)
+
+    vector = None
+    if not schemas_to_match and schema.env.vectorize:
+        vector = NumericItems(additional_items)
 
     def handler(instance, convert=False, partial=False):
+        ok = vector and vector.mask(instance)
+        if ok is not None:
+            if convert:
+                return vector.convert(instance, ok)
+            if ok.all():
+                return None
+
         results = schema_matches(instance, schemas_to_match, fill=additional_items, convert=convert)
 
         if convert:
@@ -52,6 +64,23 @@ def items(schema, value):
         if not all(results):
             raise ConstraintFailure("a sub-schema does not match", sub_errors=results)
 
+    def is_valid(instance, partial=False):
+        ok = vector and vector.mask(instance)
+        if ok is not None:
+            return bool(ok.all())
+        for v, s in itertools.zip_longest(instance, schemas_to_match, fillvalue=additional_items):
+            if s is False or v is Undefined:
+                return False
+            if not s:
+                break
+            if not s.is_valid(v):
+                return False
+        return True
+
+    handler.is_valid = is_valid
+    handler.schemas_to_match = schemas_to_match
+    handler.additional_items = additional_items
+    handler.vector = vector
     return handler
 
 
@@ -71,6 +100,10 @@ def max_items(schema, value):
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return len(instance) <= value
+
+    handler.is_valid = is_valid
     return handler
 
 
@@ -83,6 +116,10 @@ def min_items(schema, value):
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return len(instance) >= value
+
+    handler.is_valid = is_valid
     return handler
 
 
@@ -106,6 +143,10 @@ def unique_items(schema, value):
         if len(unique_set(instance)) != len(instance):
             raise ConstraintFailure()
 
+    def is_valid(instance, partial=False):
+        return len(unique_set(instance)) == len(instance)
+
+    handler.is_valid = is_valid
     return handler
 
 
@@ -115,7 +156,7 @@ def unique_items(schema, value):
     exclude=[str],
 )
 def contains(schema, value):
-    sub_schema = schema.env.schema(value)
+    sub_schema = schema.env.subschema(value)
 
     def handler(instance, convert=False, partial=False):
         for item in instance:
@@ -124,4 +165,11 @@ def contains(schema, value):
 
         raise ConstraintFailure()
 
+    def is_valid(instance, partial=False):
+        for item in instance:
+            if sub_schema.is_valid(item):
+                return True
+        return False
+
+    handler.is_valid = is_valid
     return handler
@@ -1,8 +1,7 @@
-import logging
-from inflection import underscore
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import Callable, Set, Any
-from .base import Constraint, ConstraintFailure, register, Undefined
+from .base import Constraint, ConstraintFailure, register, Undefined, underscore
+from ..helpers import column_values
 
 
 format_registry = {}
@@ -43,22 +42,89 @@ def format_constraint(schema, value):
             raise ConstraintFailure(f"{instance!r} does not match the format: {value!r}")
         return instance
 
+    def is_valid(instance, partial=False):
+        return bool(fn(instance))
+
+    def batch(values, partial=False):
+        return [bool(fn(v)) for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
 ### Formats ###
 import re
-import ipaddress
 
-date_re = re.compile(r"^\s*(\d\d\d\d)-(\d\d)-(\d\d)\s*$")
-time_re = re.compile(r"^\s*(\d\d):(\d\d):(\d\d)(\.(\d+))?([zZ]|(([-+])(\d\d):?(\d\d)))\s*$")
-date_time_re = re.compile(
+
+class LazyRegex:
+    """A regex that isn't compiled until it's first used, so importing blazon stays cheap."""
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, name):
+        # Only called for what we don't have yet, e.g. match(), which we then keep.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = getattr(re.compile(self.pattern, self.flags), name)
+        setattr(self, name, value)
+        return value
+
+
+date_re = LazyRegex(r"^\s*(\d\d\d\d)-(\d\d)-(\d\d)\s*$")
+time_re = LazyRegex(r"^\s*(\d\d):(\d\d):(\d\d)(\.(\d+))?([zZ]|(([-+])(\d\d):?(\d\d)))\s*$")
+date_time_re = LazyRegex(
     r"^\s*(\d\d\d\d)-(\d\d)-(\d\d)[ tT](\d\d):(\d\d):(\d\d)(\.(\d+))?([zZ]|(([-+])(\d\d):?(\d\d)))\s*$"
 )
-email_re = re.compile(
+email_re = LazyRegex(
     r'(?:[a-z0-9!#$%&\'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&\'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])'
 )
-hostname_re = re.compile(r"(?!-)[A-Z\d-]{1,63}(?<!-)$", re.IGNORECASE)
+hostname_re = LazyRegex(
+    r"(?!-)[A-Z\d-]{1,63}(?<!-)(\.(?!-)[A-Z\d-]{1,63}(?<!-))*\.?", re.IGNORECASE
+)
+ipv4_octet = r"(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"  # No leading zeros, like ipaddress
+ipv4_re = LazyRegex(rf"({ipv4_octet}\.){{3}}{ipv4_octet}")
+ipv6_re = LazyRegex(r"[0-9A-Fa-f:.]*:[0-9A-Fa-f:.]*(%.+)?")
+
+### URIs and IRIs, see RFC 3986 and 3987
+# A plain scheme://host/path?query#fragment, made only of characters that are allowed anywhere in
+# a URI. That's most URIs we see, and it's valid for all four of the rules, so rfc3987 is spared.
+simple_uri_re = LazyRegex(
+    r"[A-Za-z][A-Za-z0-9+.-]*://[A-Za-z0-9.-]*(:[0-9]*)?"
+    r"(/[A-Za-z0-9\-._~!$&'()*+,;=:@]*)*"
+    r"(\?[A-Za-z0-9\-._~!$&'()*+,;=:@/?]*)?"
+    r"(#[A-Za-z0-9\-._~!$&'()*+,;=:@/?]*)?"
+)
+uri_scheme_re = LazyRegex(r"[A-Za-z][A-Za-z0-9+.-]*:")
+# Characters that can never appear in a URI, or an IRI, and bad percent-encoding.
+not_uri_re = LazyRegex(r"[^A-Za-z0-9\-._~:/?#\[\]@!$&'()*+,;=%]|%(?![0-9A-Fa-f]{2})")
+not_iri_re = LazyRegex(r"[\x00-\x20\x7f-\x9f<>\"{}|\\^`]|%(?![0-9A-Fa-f]{2})")
+
+
+@lru_cache(maxsize=None)
+def rfc3987_match():
+    """Returns rfc3987.match, or None when the package is missing, which we only warn about once."""
+    try:
+        import rfc3987
+    except ImportError:
+        import logging
+
+        logging.warning("package rfc3987 missing - cannot fully validate uris or iris - they pass")
+        return None
+    return rfc3987.match
+
+
+def check_uri(instance, rule, invalid, absolute):
+    if simple_uri_re.fullmatch(instance):
+        return True
+    if invalid.search(instance) or (absolute and not uri_scheme_re.match(instance)):
+        return False
+    match = rfc3987_match()
+    if match is None:
+        return True
+    return match(instance, rule=rule) is not None
 
 
 @format
@@ -83,24 +149,21 @@ def email(instance):
 
 @format
 def hostname(instance):
-    if len(instance) > 255:
-        return False
-    if instance[-1] == ".":
-        instance = instance[:-1]
-    return all(hostname_re.match(x) for x in instance.split("."))
+    return len(instance) <= 255 and hostname_re.fullmatch(instance) is not None
 
 
 @format
 def ipv4(instance):
-    try:
-        ipaddress.IPv4Address(instance)
-        return True
-    except ValueError:
-        return False
+    return ipv4_re.fullmatch(instance) is not None
 
 
 @format
 def ipv6(instance):
+    if ipv6_re.fullmatch(instance) is None:
+        return False
+
+    import ipaddress
+
     try:
         ipaddress.IPv6Address(instance)
         return True
@@ -110,39 +173,19 @@ def ipv6(instance):
 
 @format
 def uri(instance):
-    try:
-        import rfc3987
-    except ImportError:
-        logging.warning("package rfc3987 missing - cannot validate uri - so it passes")
-        return True
-    return rfc3987.match(instance, rule="URI")
+    return check_uri(instance, "URI", not_uri_re, absolute=True)
 
 
 @format
 def uri_reference(instance):
-    try:
-        import rfc3987
-    except ImportError:
-        logging.warning("package rfc3987 missing - cannot validate uri-reference - so it passes")
-        return True
-    return rfc3987.match(instance, rule="URI_reference")
+    return check_uri(instance, "URI_reference", not_uri_re, absolute=False)
 
 
 @format
 def iri(instance):
-    try:
-        import rfc3987
-    except ImportError:
-        logging.warning("package rfc3987 missing - cannot validate iri - so it passes")
-        return True
-    return rfc3987.match(instance, rule="IRI")
+    return check_uri(instance, "IRI", not_iri_re, absolute=True)
 
 
 @format
 def iri_reference(instance):
-    try:
-        import rfc3987
-    except ImportError:
-        logging.warning("package rfc3987 missing - cannot validate iri-reference - so it passes")
-        return True
-    return rfc3987.match(instance, rule="IRI_reference")
+    return check_uri(instance, "IRI_reference", not_iri_re, absolute=False)
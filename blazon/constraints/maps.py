@@ -1,4 +1,5 @@
 import blazon, re
+from functools import lru_cache
 from collections.abc import Mapping, Iterable
 from .base import register, constraints, ConstraintFailure, Undefined, ValidationError
 from .containers import min_items, max_items
@@ -18,11 +19,68 @@ def regex(source):
     return re.compile(source)
 
 
-def any_matches(name, patterns):
-    for r in patterns:
-        if r.search(name):
-            return True
-    return False
+### How many entry names each PatternMap remembers the answers for.
+PATTERN_MEMO_SIZE = 1024
+
+### Numbered backreferences and conditionals break once the patterns are wrapped in groups.
+numbered_group_re = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def combine(patterns):
+    """
+    Combines the regexes into one alternation, each wrapped in a named group so a match tells us
+    which one matched. Returns None when that isn't safe, or wouldn't help.
+    """
+    if len(patterns) < 2 or len(set(p.flags for p in patterns)) > 1:
+        return None
+    if any(not isinstance(p.pattern, str) or numbered_group_re.search(p.pattern) for p in patterns):
+        return None
+    source = "|".join(f"(?P<_blazon{i}>{p.pattern})" for i, p in enumerate(patterns))
+    try:
+        return re.compile(source, patterns[0].flags)
+    except re.error:
+        return None
+
+
+class PatternMap:
+    """
+    Maps regexes to values, like the sub-schemas of pattern-entries. `lookup(name)` returns the
+    values for every regex that matches the name, and `any(name)` whether one does. The regexes are
+    first searched all at once with a combined alternation, so a name that matches nothing costs a
+    single search. The answers are memoized by name.
+    """
+
+    def __init__(self, items):
+        items = [(regex(k), v) for k, v in items]
+        self.patterns = [p for p, _ in items]
+        self.values = [v for _, v in items]
+        self.combined = combine(self.patterns)
+        if self.combined is not None:
+            self.dispatch = {
+                self.combined.groupindex[f"_blazon{i}"]: i for i in range(len(self.patterns))
+            }
+        self.lookup = lru_cache(maxsize=PATTERN_MEMO_SIZE)(self._lookup)
+        self.any = lru_cache(maxsize=PATTERN_MEMO_SIZE)(self._any)
+
+    def _lookup(self, name):
+        if self.combined is None:
+            return tuple(v for p, v in zip(self.patterns, self.values) if p.search(name))
+        match = self.combined.search(name)
+        if match is None:
+            return ()
+        # The group that matched is the outermost one to close, so it's one of ours. The others
+        # could still match further along the name, so they get their own search.
+        first = self.dispatch[match.lastindex]
+        return tuple(
+            v
+            for i, (p, v) in enumerate(zip(self.patterns, self.values))
+            if i == first or p.search(name)
+        )
+
+    def _any(self, name):
+        if self.combined is None:
+            return any(p.search(name) for p in self.patterns)
+        return self.combined.search(name) is not None
 
 
 ### Constraints ###
@@ -55,6 +113,21 @@ def required(schema, value):
 
         return instance
 
+    def is_valid(instance, partial=False):
+        if partial:
+            return True
+        for key in value:
+            if key not in instance:
+                return False
+        return True
+
+    def check_columns(name, columns, rows, partial=False):
+        if partial or all(key in columns for key in value):
+            return {}
+        return {name: list(range(rows))}
+
+    handler.is_valid = is_valid
+    handler.check_columns = check_columns
     return handler
 
 
@@ -69,7 +142,7 @@ def entry_handler(generator):
                 if sub_schema is True:
                     instance[name] = value
                 if hasattr(value, "__schema__"):
-                    value = value.__dict__
+                    value = value.get_raw_value()
                 try:
                     instance[name] = sub_schema(value)
                 except ValidationError as e:
@@ -90,12 +163,23 @@ def entry_handler(generator):
             raise ConstraintFailure("not all entries match", sub_errors=errors)
         return instance
 
+    def is_valid(instance, partial=False):
+        for name, sub_schema, value in generator(instance):
+            if sub_schema is False:
+                return False
+            if sub_schema is True:
+                continue
+            if not sub_schema.is_valid(value):
+                return False
+        return True
+
+    handler.is_valid = is_valid
     return handler
 
 
 @register(description="must have the matching items", require=[Mapping])
 def entries(schema, value):
-    schema_map = dict((k, schema.env.schema(v)) for k, v in value.items())
+    schema_map = dict((k, schema.env.subschema(v)) for k, v in value.items())
 
     for name, schema in schema_map.items():
         if schema is None:
@@ -106,7 +190,26 @@ def entries(schema, value):
             if name in instance:
                 yield name, schema, instance[name]
 
-    return entry_handler(generator)
+    def is_valid(instance, partial=False):
+        for name, schema in schema_map.items():
+            if name in instance and not schema.is_valid(instance[name]):
+                return False
+        return True
+
+    def check_columns(name, columns, rows, partial=False):
+        failures = {}
+        for key, sub_schema in schema_map.items():
+            if key in columns:
+                failed = [i for i, ok in enumerate(sub_schema.check_column(columns[key])) if not ok]
+                if failed:
+                    failures[key] = failed
+        return failures
+
+    handler = entry_handler(generator)
+    handler.is_valid = is_valid
+    handler.check_columns = check_columns
+    handler.schema_map = schema_map
+    return handler
 
 
 @register(
@@ -114,31 +217,32 @@ def entries(schema, value):
     require=[Mapping],
 )
 def pattern_entries(schema, value):
-    regex_schema_map = dict((regex(src), schema.env.schema(v)) for src, v in value.items())
+    pattern_map = PatternMap((src, schema.env.subschema(v)) for src, v in value.items())
 
     def generator(instance):
         for name, value in instance.items():
-            for regex, schema in regex_schema_map.items():
-                if regex.search(name):
-                    yield name, schema, value
+            for sub_schema in pattern_map.lookup(name):
+                yield name, sub_schema, value
 
-    return entry_handler(generator)
+    handler = entry_handler(generator)
+    handler.pattern_map = pattern_map
+    return handler
 
 
 @register(
     description="additional properties must match the sub-schema: {value!r}", require=[Mapping],
 )
 def additional_entries(schema, value):
-    patterns = [regex(k) for k in schema.get("pattern_entries", {}).keys()]
+    patterns = PatternMap((k, True) for k in schema.get("pattern_entries", {}).keys())
     names = set(k for k in schema.get("entries", {}).keys())
     if value is False or value is True:
         match_schema = value
     else:
-        match_schema = schema.env.schema(value)
+        match_schema = schema.env.subschema(value)
 
     def generator(instance):
         for name, value in instance.items():
-            if name in names or any_matches(name, patterns):
+            if name in names or patterns.any(name):
                 continue
             yield name, match_schema, value
 
@@ -154,7 +258,7 @@ def dependencies(schema, value):
 
     for key, value in value.items():
         if isinstance(value, Mapping):
-            dependant_schemas[key] = schema.env.schema(value)
+            dependant_schemas[key] = schema.env.subschema(value)
         elif isinstance(value, Iterable):
             dependant_requirements[key] = [str(x) for x in value]
         else:
@@ -187,6 +291,19 @@ def dependencies(schema, value):
                         raise
         return instance
 
+    def is_valid(instance, partial=False):
+        for key, requirements in dependant_requirements.items():
+            if key in instance:
+                for other_key in requirements:
+                    if other_key not in instance:
+                        return False
+
+        for key, schema in dependant_schemas.items():
+            if key in instance and not schema.is_valid(instance):
+                return False
+        return True
+
+    handler.is_valid = is_valid
     return handler
 
 
@@ -194,11 +311,18 @@ def dependencies(schema, value):
     description="entry names must match the given schema", require=[Mapping],
 )
 def entry_names(schema, value):
-    name_schema = schema.env.schema(value)
+    name_schema = schema.env.subschema(value)
 
     def handler(instance, convert=False, partial=False):
         for key in instance.keys():
             if not name_schema.validate(key):
                 raise ConstraintFailure()
 
+    def is_valid(instance, partial=False):
+        for key in instance.keys():
+            if not name_schema.is_valid(key):
+                return False
+        return True
+
+    handler.is_valid = is_valid
     return handler
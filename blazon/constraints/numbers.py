@@ -1,6 +1,20 @@
+import operator
 from typing import Callable, Set, Any
 from numbers import Number
 from .base import Constraint, ConstraintFailure, register
+from ..helpers import bound_array, column_values
+
+
+def bound_batch(compare, value):
+    """A batch check for a column, see Schema.validate_columns()"""
+
+    def batch(values, partial=False):
+        arr = bound_array(values, value)
+        if arr is not None:
+            return compare(arr, value)
+        return [compare(v, value) for v in column_values(values)]
+
+    return batch
 
 
 @register(description="must be a multiple of {value!r}", require=[Number])
@@ -10,6 +24,17 @@ def multiple_of(schema, value):
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return instance % value == 0
+
+    def batch(values, partial=False):
+        arr = bound_array(values, value)
+        if arr is not None and value:
+            return arr % value == 0
+        return [v % value == 0 for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
@@ -23,6 +48,11 @@ def maximum(schema, value):
                 return instance
             raise ConstraintFailure(f"must be smaller than {value!r}")
 
+        def is_valid(instance, partial=False):
+            return instance < value
+
+        batch = bound_batch(operator.lt, value)
+
     else:
 
         def handler(instance, convert=False, partial=False):
@@ -34,6 +64,13 @@ def maximum(schema, value):
 
             raise ConstraintFailure(f"must be no larger than {value!r}")
 
+        def is_valid(instance, partial=False):
+            return instance <= value
+
+        batch = bound_batch(operator.le, value)
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
@@ -52,6 +89,11 @@ def minimum(schema, value):
                 return instance
             raise ConstraintFailure(f"must be larger than {value!r}")
 
+        def is_valid(instance, partial=False):
+            return instance > value
+
+        batch = bound_batch(operator.gt, value)
+
     else:
 
         def handler(instance, convert=False, partial=False):
@@ -63,6 +105,13 @@ def minimum(schema, value):
 
             raise ConstraintFailure(f"must be no smaller than {value!r}")
 
+        def is_valid(instance, partial=False):
+            return instance >= value
+
+        batch = bound_batch(operator.ge, value)
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
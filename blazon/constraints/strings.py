@@ -2,6 +2,7 @@ import re
 from typing import Callable, Set, Any
 from numbers import Number
 from .base import Constraint, ConstraintFailure, register
+from ..helpers import column_values
 
 
 ### Strings ###
@@ -14,6 +15,14 @@ def max_length(schema, value):
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return len(instance) <= value
+
+    def batch(values, partial=False):
+        return [len(v) <= value for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
@@ -24,14 +33,34 @@ def min_length(schema, value):
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return len(instance) >= value
+
+    def batch(values, partial=False):
+        return [len(v) >= value for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
     return handler
 
 
 @register(description="must match the pattern {value!r}", require=[str])
 def pattern(schema, value):
+    regex = re.compile(value)
+    search = regex.search
+
     def handler(instance, convert=False, partial=False):
-        if re.search(value, instance) is None:
+        if search(instance) is None:
             raise ConstraintFailure()
         return instance
 
+    def is_valid(instance, partial=False):
+        return search(instance) is not None
+
+    def batch(values, partial=False):
+        return [search(v) is not None for v in column_values(values)]
+
+    handler.is_valid = is_valid
+    handler.batch = batch
+    handler.regex = regex
     return handler
@@ -0,0 +1,132 @@
+"""
+  Checks long arrays of numbers all at once with NumPy, for environments that turn on `vectorize`.
+  It applies to `items` whose sub-schema is nothing more than a numeric type with minimum, maximum,
+  and multiple-of constraints. Anything else, or anything NumPy can't hold exactly, goes through
+  the sub-schema item by item like always.
+"""
+
+from functools import lru_cache
+from numbers import Number
+from ..helpers import Undefined, MAX_EXACT_INT
+from . import numbers
+
+### Arrays shorter than this aren't worth the trip through NumPy.
+MIN_ITEMS = 256
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """Returns numpy, or None when it's missing, which we only warn about once."""
+    try:
+        import numpy
+    except ImportError:
+        import logging
+
+        logging.warning("package numpy missing - cannot vectorize numeric items")
+        return None
+    return numpy
+
+
+class NumericItems:
+    """
+    Vectorized checks for the given items sub-schema. The plan is made the first time it's needed,
+    since the sub-schema might not be compiled yet.
+    """
+
+    def __init__(self, sub):
+        self.sub = sub
+        self.types = Undefined
+        self.ops = Undefined
+
+    def plan(self):
+        sub = self.sub
+        if not sub.compiled:
+            sub.compile_lazily()
+        types = sub.type if isinstance(sub.type, tuple) else (sub.type,)
+        if not all(isinstance(t, type) and issubclass(t, Number) for t in types):
+            return None, None
+
+        ops = []
+        for key in sub.constraints:
+            if key == "type":
+                continue
+            compiler = sub.env.get_constraint(key).compiler
+            value = sub.value[key]
+            if compiler is numbers.minimum:
+                ops.append((">" if sub.get("exclusive_minimum", False) else ">=", value))
+            elif compiler is numbers.maximum:
+                ops.append(("<" if sub.get("exclusive_maximum", False) else "<=", value))
+            elif compiler is numbers.multiple_of and value:
+                ops.append(("%", value))
+            else:
+                return None, None
+        return types, ops
+
+    def array(self, np, instance):
+        """Returns the instance as a 1-d numeric array, or None if we shouldn't."""
+        if self.ops is Undefined:
+            self.types, self.ops = self.plan()
+        if self.ops is None:
+            return None
+        if isinstance(instance, np.ndarray):
+            if instance.ndim != 1 or not issubclass(instance.dtype.type, self.types):
+                return None
+            arr = instance
+        elif isinstance(instance, (list, tuple)):
+            kinds = set(map(type, instance))
+            if not all(issubclass(t, self.types) for t in kinds):
+                return None
+            arr = np.asarray(instance)
+            if arr.dtype.kind == "f" and any(issubclass(t, int) for t in kinds):
+                # Ints mixed in with floats got upcast, and big ones lost precision on the way.
+                if any(abs(v) >= MAX_EXACT_INT for v in instance if isinstance(v, int)):
+                    return None
+        else:
+            return None
+        if arr.dtype.kind not in "biuf":
+            return None
+        if arr.dtype.kind != "f" and any(isinstance(v, float) for _, v in self.ops):
+            if len(arr) and np.abs(arr).max() >= MAX_EXACT_INT:
+                return None
+        return arr
+
+    def mask(self, instance):
+        """
+        Returns a boolean array, True for each item that passes the sub-schema untouched, or None
+        when the instance can't be vectorized.
+        """
+        if isinstance(instance, (list, tuple)) and len(instance) < MIN_ITEMS:
+            return None
+        np = get_numpy()
+        if np is None:
+            return None
+        arr = self.array(np, instance)
+        if arr is None or len(arr) < MIN_ITEMS:
+            return None
+
+        ok = np.ones(len(arr), dtype=bool)
+        try:
+            for op, value in self.ops:
+                if op == ">=":
+                    ok &= arr >= value
+                elif op == ">":
+                    ok &= arr > value
+                elif op == "<=":
+                    ok &= arr <= value
+                elif op == "<":
+                    ok &= arr < value
+                else:
+                    ok &= np.remainder(arr, value) == 0
+        except (OverflowError, TypeError):
+            return None
+        return ok
+
+    def convert(self, instance, ok):
+        """
+        Converts with the mask from mask(). Items that pass are kept as they are, the rest go
+        through the sub-schema, in order, so clamping and the first error are just like one by one.
+        """
+        results = list(instance)
+        for i in (~ok).nonzero()[0]:
+            results[i] = self.sub(results[i])
+        return results
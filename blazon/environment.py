@@ -1,20 +1,145 @@
-import logging, warnings
-from dataclasses import dataclass, field
+from uuid import uuid4
+from threading import RLock
+from importlib import import_module
+from weakref import WeakValueDictionary, ref
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from typing import Dict, Callable, Type, Union
 from datetime import date, datetime, time
 from collections.abc import Mapping, MutableMapping, Sequence, Callable
 from numbers import Number
 from decimal import Decimal
-from inflection import underscore
-
 from .helpers import (
+    underscore,
+    memoize_inflection,
+    picklable_inflection,
     ValidationError,
     Undefined,
     SchemaValidationResult,
     ConstraintKeyError,
+    structural_key,
 )
 from .schema import Schema
 from .constraints import constraints, ConstraintRegistry
+from .profiling import Profile
+
+
+class SchemaRegistry(MutableMapping):
+    """
+    Where an environment keeps its schemas. Named schemas are always kept. Anonymous ones, keyed by
+    their hash, are kept according to `anonymous`:
+
+        None     -- keep them forever (the default)
+        "weak"   -- keep them only as long as something else references them
+        <int>    -- keep only the most recently used this many of them
+
+    `evictions` counts how many anonymous schemas have been dropped.
+
+    Changes are made under a lock, so many threads can add schemas at once. Reads don't take it.
+    """
+
+    def __init__(self, schemas=None, anonymous=None):
+        self.named = {}
+        self.anonymous = OrderedDict()
+        self.mode = anonymous
+        self.evictions = 0
+        self.lock = RLock()  # Reentrant, a weakref callback can fire while we hold it.
+        self.update(schemas or {})
+
+    def __repr__(self):
+        named, anonymous = len(self.named), len(self.anonymous)
+        return f"{self.__class__.__name__}(named={named}, anonymous={anonymous})"
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.named[key]
+        schema = self.anonymous[key]
+        if self.mode == "weak":
+            schema = schema()
+            if schema is None:
+                raise KeyError(key)
+        elif self.mode is not None:
+            try:
+                self.anonymous.move_to_end(key)
+            except KeyError:
+                pass  # Another thread evicted it just now.
+        return schema
+
+    def __setitem__(self, key, schema):
+        with self.lock:
+            if isinstance(key, str):
+                self.named[key] = schema
+            elif self.mode == "weak":
+                self.anonymous[key] = ref(schema, self._weak_callback(key))
+            else:
+                self.anonymous[key] = schema
+                if self.mode is not None:
+                    self.anonymous.move_to_end(key)
+                    while len(self.anonymous) > self.mode:
+                        self.anonymous.popitem(last=False)
+                        self.evictions += 1
+
+    def __delitem__(self, key):
+        with self.lock:
+            if isinstance(key, str):
+                del self.named[key]
+            else:
+                del self.anonymous[key]
+
+    def __iter__(self):
+        yield from list(self.named)
+        for key, schema in list(self.anonymous.items()):
+            if self.mode != "weak" or schema() is not None:
+                yield key
+
+    def __len__(self):
+        return len(self.named) + len(self.anonymous)
+
+    def set_anonymous(self, anonymous):
+        """Changes how anonymous schemas are kept, see the class docstring."""
+        with self.lock:
+            schemas = [(k, self.get(k)) for k in list(self.anonymous)]
+            self.anonymous = OrderedDict()
+            self.mode = anonymous
+            for key, schema in schemas:
+                if schema is not None:
+                    self[key] = schema
+
+    def stats(self):
+        return {
+            "named": len(self.named),
+            "anonymous": len(self.anonymous),
+            "evictions": self.evictions,
+        }
+
+    def _weak_callback(self, key):
+        def callback(reference):
+            with self.lock:
+                if self.anonymous.get(key) is reference:
+                    del self.anonymous[key]
+                    self.evictions += 1
+
+        return callback
+
+
+### Pickling environments, see Environment.__reduce__() ###
+### Environments that are pickled by reference, by name, to "module:attribute".
+shared_environments = {}
+
+### Environments pickled by value in this process, or unpickled into it, by their pickle key.
+pickled_environments = WeakValueDictionary()
+
+
+def shared_environment(path):
+    module, _, attr = path.partition(":")
+    return getattr(import_module(module), attr)
+
+
+def rebuild_environment(cls, settings, key):
+    env = pickled_environments.get(key)
+    if env is None:
+        env = cls(**settings)
+    return env
 
 
 @dataclass  # We can't use Blazon for Blazon, unfortunately. It'd be a lot cooler if you did.
@@ -23,12 +148,21 @@ class Environment:
 
     name: str
     inflection: Callable = field(default=underscore, repr=False)
-    schemas: Dict[str, Schema] = field(default_factory=dict, repr=False)
+    schemas: SchemaRegistry = field(default_factory=SchemaRegistry, repr=False)
     strict: bool = True  # If strict is true, we will raise errors when constraints cannot be found.
     ignore_formats: bool = field(default=False, repr=False)  # Ignore 'format' constraint
     ignore_these_formats: set = field(default_factory=set, repr=False)  # Ignore the given formats.
+    generate_code: bool = field(default=False, repr=False)  # Run schemas through blazon.codegen
+    lazy: bool = field(default=False, repr=False)  # Compile nested schemas on their first use
+    vectorize: bool = field(default=False, repr=False)  # Check long numeric arrays with NumPy
+    adaptive: bool = field(default=False, repr=False)  # Reorder is_valid() checks, blazon.ordering
+    profiling: bool = field(default=False, repr=False)  # Count into `profile`, see set_profiling()
+    profile: Profile = field(default_factory=Profile, repr=False, compare=False)
     constraints: ConstraintRegistry = field(default=constraints, repr=False)
     schematics: Dict[str, "Schematic"] = field(default_factory=dict, repr=False)
+    subschemas: WeakValueDictionary = field(
+        default_factory=WeakValueDictionary, repr=False, compare=False
+    )
     primitives: Dict[str, object] = field(
         repr=False,
         default_factory=lambda: {
@@ -54,11 +188,54 @@ class Environment:
         },
     )
 
+    def __post_init__(self):
+        self.inflection = memoize_inflection(self.inflection)
+        if not isinstance(self.schemas, SchemaRegistry):
+            self.schemas = SchemaRegistry(self.schemas)
+
+    def __reduce__(self):
+        # Environments that blazon makes on import, like native and json, are the same objects
+        # wherever they're unpickled. Others are pickled by value, settings and named schemas, and
+        # keep a key so that pickling one back to where it came from gets the original.
+        path = shared_environments.get(self.name)
+        if path is not None and shared_environment(path) is self:
+            return shared_environment, (path,)
+
+        key = self.__dict__.setdefault("_pickle_key", uuid4().hex)
+        pickled_environments[key] = self
+        skip = ("schemas", "subschemas", "_pickle_key")
+        settings = {f.name: getattr(self, f.name) for f in fields(self) if f.name not in skip}
+        settings["inflection"] = picklable_inflection(self.inflection)
+        state = {k: v for k, v in self.__dict__.items() if k not in settings and k not in skip}
+        state["_pickle_key"] = key
+        state["named"] = [(s.value, s.name, s.strict) for s in self.schemas.named.values()]
+        return rebuild_environment, (self.__class__, settings, key), state
+
+    def __setstate__(self, state):
+        if "_pickle_key" in self.__dict__:
+            return  # It's one we already had.
+        state = dict(state)
+        named = state.pop("named")
+        self.__dict__.update(state)
+        pickled_environments[self._pickle_key] = self
+        for value, name, strict in named:
+            self.schema(value, name=name, strict=strict, lazy=True)
+
+    def set_profiling(self, profiling=True) -> None:
+        """
+        Turns profiling on or off, recompiling the schemas so it applies to them. The counters are
+        in `env.profile`, see blazon.profiling.Profile.
+        """
+        self.profiling = profiling
+        self._recompile_schemas()
+
     def primitive(self, name: str, type: Type) -> None:
         self.primitives[name] = type
         self._recompile_schemas()
 
-    def schema(self, value: Union[Dict, Schema, None], name: str = None, strict=None) -> Schema:
+    def schema(
+        self, value: Union[Dict, Schema, None], name: str = None, strict=None, lazy=False
+    ) -> Schema:
         if value is None:
             return None
         if strict is None:
@@ -69,9 +246,30 @@ class Environment:
             schema = Schema(value, name=name, env=self, strict=strict)
         key = schema.name or hash(schema)
         self.schemas[key] = schema
+        if lazy:
+            return schema
         schema = schema.compile()
         return schema
 
+    def subschema(self, value: Union[Dict, Schema, None], strict=None) -> Schema:
+        """
+        Like schema(), but for the anonymous schemas nested inside of other schemas. These are
+        shared by structure, so identical subschemas are only compiled once in an environment. If
+        the environment is `lazy`, they aren't compiled until an instance first reaches them.
+        """
+        if not isinstance(value, Mapping):
+            return self.schema(value, strict=strict)
+        if strict is None:
+            strict = self.strict
+        try:
+            key = (structural_key(value), strict)
+        except TypeError:
+            return self.schema(value, strict=strict)
+        schema = self.subschemas.get(key)
+        if schema is None:
+            schema = self.subschemas[key] = self.schema(value, strict=strict, lazy=self.lazy)
+        return schema
+
     def get_schema(self, key):
         return self.schemas.get(key, None)
 
@@ -82,12 +280,16 @@ class Environment:
         return self.primitives[name]
 
     def get_named_schemas(self):
-        return {k: v for k, v in self.schemas.items() if isinstance(k, str)}
+        return dict(self.schemas.named)
 
     ### Internals ###
     def _recompile_schemas(self) -> None:
-        for schema in self.schemas.values():
-            schema.compile(self)
+        # Ones that haven't been compiled yet will see the change when they are.
+        for key in list(self.schemas):
+            schema = self.schemas.get(key)
+            if schema is not None and schema.compiled:
+                schema.compile()
 
 
 native = Environment(name="native")
+shared_environments[native.name] = f"{__name__}:native"
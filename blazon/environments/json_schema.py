@@ -1,8 +1,9 @@
 import os
 from abc import ABC
-from inflection import camelize
+from ..helpers import camelize, memoize_inflection
 from ..constraints import constraints
-from ..environment import Environment
+from ..environment import Environment, shared_environments
+from ..schema import Schema
 from dataclasses import MISSING
 
 
@@ -33,7 +34,10 @@ class ObjectResolver:
         self.file = file
 
 
-json_inflection = lambda x: camelize(x.replace("-", "_"), False)
+@memoize_inflection
+def json_inflection(x):
+    return camelize(x.replace("-", "_"), False)
+
 
 json_constraints = constraints.clone(
     inflection=json_inflection,
@@ -116,8 +120,24 @@ class JSONEnvironment(Environment):
 
         self._file = value
 
+        if name is MISSING:
+            name = None
         return self.schema(value, name=name)  # , resolver=file_resolver(value, filename=file)
 
+    def stream(self, schema, source, convert=True, chunk_size=None):
+        """
+        Validates the items of a big JSON array, or NDJSON, as they're read from `source`, a path or
+        a stream, so only one item is in memory at a time. Yields each converted instance, or the
+        instance as it is when `convert` is False. For each item that fails, it instead yields a
+        StreamError(index, error), as it does for NDJSON lines that can't be parsed.
+        """
+        from ..streaming import iter_json, check_items, CHUNK_SIZE
+
+        if not isinstance(schema, Schema):
+            schema = self.schema(schema)
+
+        return check_items(schema, iter_json(source, chunk_size or CHUNK_SIZE), convert)
+
 
 env = JSONEnvironment(
     name="jsonSchema",
@@ -135,6 +155,8 @@ env = JSONEnvironment(
     },
 )
 
+shared_environments[env.name] = f"{__name__}:env"
+
 schema = env.schema
 
 
@@ -1,4 +1,5 @@
-import typing, textwrap
+import sys, typing, textwrap, weakref
+from functools import lru_cache
 from collections.abc import Mapping, Iterable
 
 ### Hash function
@@ -7,14 +8,15 @@ def hashish(obj):
     Turns anything into a sort of hash (hash-ish). Sort of, because if an object within it can't be
     hashed, it pretends its id() is the hash. This works for our purposes.
     """
-    # First, is it actually hashable? Then good.
-    if getattr(obj, "__hash__", None):
-        return hash(obj)
     # If it's a mapping, get the hash of it's keys and items
     if isinstance(obj, Mapping):
-        hash_keys = hashish(obj.keys())
-        hash_values = hashish(obj.values())
-        return hash((hash_keys, hash_values))
+        return hash(tuple((hashish(k), hashish(v)) for k, v in obj.items()))
+    # Is it actually hashable? Then good.
+    if getattr(obj, "__hash__", None):
+        try:
+            return hash(obj)
+        except TypeError:
+            pass
     # If it's an iterable, hash the tuple of it and it's items
     if isinstance(obj, Iterable):
         return hash(tuple(hashish(x) for x in obj))
@@ -23,11 +25,142 @@ def hashish(obj):
     return id(obj)
 
 
+### Structural key
+def structural_key(obj):
+    """
+    Turns a schema value into a hashable key that is equal for values that are structurally the
+    same, so {"type": "string"} written out in a thousand places always gets the same key. Raises
+    a TypeError if something inside can't be hashed.
+    """
+    if isinstance(obj, Mapping):
+        return (type(obj), tuple((k, structural_key(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj), tuple(structural_key(x) for x in obj))
+    if isinstance(obj, (set, frozenset)):
+        return (type(obj), frozenset(structural_key(x) for x in obj))
+    # Include the type so 1, 1.0 and True don't end up as the same key.
+    hash(obj)
+    return (type(obj), obj)
+
+
+### Inflection
+inflection_memos = weakref.WeakSet()  # Every live memo, for inflection_stats()
+
+
+def memoize_inflection(fn, maxsize=4096):
+    """
+    Wraps an inflection function, like inflection.underscore, with a bounded memo. The memo is kept
+    on the function, so it's shared by everything that inflects with it, and goes when it does.
+    Functions that can't hold one, like builtins or bound methods, get a memo of their own each
+    time. See inflection_stats().
+    """
+    if fn in inflection_memos:
+        return fn
+    attrs = getattr(fn, "__dict__", None)
+    memo = attrs.get("inflection_memo") if isinstance(attrs, dict) else None
+    if memo is None:
+        memo = lru_cache(maxsize=maxsize)(fn)
+        inflection_memos.add(memo)
+        if isinstance(attrs, dict):
+            attrs["inflection_memo"] = memo
+    return memo
+
+
+def inflection_stats():
+    """
+    Returns the hits, misses, and sizes of the inflection memos, by function name. Names that aren't
+    unique, like lambdas, have the function's id on the end.
+    """
+    stats = {}
+    for memo in list(inflection_memos):
+        fn = memo.__wrapped__
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        if "<" in name or name in stats:
+            name = f"{name} at {id(fn):#x}"
+        stats[name] = memo.cache_info()._asdict()
+    return stats
+
+
+def picklable_inflection(memo):
+    """
+    Returns what to pickle for a memoized inflection function. The memo pickles by reference when
+    it's what the module has by that name, like underscore() below, otherwise the function it wraps
+    does, and it's just memoized again when it's unpickled.
+    """
+    fn = getattr(memo, "__wrapped__", memo)
+    module = sys.modules.get(fn.__module__)
+    if getattr(module, fn.__qualname__, None) is fn:
+        return fn
+    return memo
+
+
+@memoize_inflection
+def underscore(word):
+    """Like inflection.underscore, but words that are already lowercase don't need it imported."""
+    if word.lower() == word:
+        return word.replace("-", "_")
+    import inflection
+
+    return inflection.underscore(word)
+
+
+@memoize_inflection
+def camelize(word, uppercase_first_letter=True):
+    import inflection
+
+    return inflection.camelize(word, uppercase_first_letter)
+
+
 ### Identity function
 def identity(x):
     return x
 
 
+### Columns, see Schema.validate_columns() ###
+### The python types of the values in numeric NumPy arrays, by dtype kind.
+array_types = {"b": bool, "i": int, "u": int, "f": float}
+
+### Past this, int64 values don't all survive being compared with a float.
+MAX_EXACT_INT = 2 ** 53
+
+
+def numeric_array(values):
+    """Returns the values if they're a 1-d numeric NumPy array, or None. Never imports numpy."""
+    np = sys.modules.get("numpy")
+    if np is None or not isinstance(values, np.ndarray):
+        return None
+    if values.ndim != 1 or values.dtype.kind not in array_types:
+        return None
+    return values
+
+
+def bound_array(values, bound):
+    """Like numeric_array(), but only if comparing the values to the bound is exact."""
+    arr = numeric_array(values)
+    if arr is None or not isinstance(bound, (int, float)):
+        return None
+    if arr.dtype.kind != "f" and isinstance(bound, float) and len(arr):
+        if abs(arr).max() >= MAX_EXACT_INT:
+            return None
+    return arr
+
+
+def column_values(values):
+    """Returns the values of a column as python values, so NumPy arrays become lists."""
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return values
+
+
+def column_check(check):
+    """Builds a batch check for a column out of an is_valid() check."""
+
+    def batch(values, partial=False):
+        return [check(v, partial) for v in column_values(values)]
+
+    return batch
+
+
 ### Undefined ###
 class Undefined:
     def __repr__(self):
@@ -58,6 +191,10 @@ class SchemaFailure(ValidationError):
         self.message = message
         self.sub_errors = {}
 
+    def __reduce__(self):
+        state = {k: v for k, v in self.__dict__.items() if k != "context"}
+        return self.__class__, (self.schema, self.constraints, self.message), state
+
     def __str__(self):
         return self.format()
 
@@ -114,6 +251,9 @@ class SchemaValidationResult(ValidationError):
                 self.success = False
                 break
 
+    def __reduce__(self):
+        return self.__class__, (self.schema, self.instance, self.errors)
+
     def __bool__(self):
         return self.success
 
@@ -150,6 +290,59 @@ class SchemaValidationResult(ValidationError):
         print(self.format())
 
 
+class BatchResult:
+    """
+    The result of Schema.validate_many() or convert_many(). `valid` has a flag for each instance, in
+    order, and `errors` maps the position of every instance that failed to its error. For
+    convert_many(), `values` holds the converted instances, with None where conversion failed.
+    """
+
+    def __init__(self, schema, valid, errors, values=None):
+        self.schema = schema
+        self.valid = valid
+        self.errors = errors
+        self.values = values
+
+    def __bool__(self):
+        return not self.errors
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(total={len(self.valid)}, failed={len(self.errors)})"
+
+    def failed(self):
+        """Returns the positions of the instances that failed, in order."""
+        return sorted(self.errors)
+
+
+class ColumnResult:
+    """
+    The result of Schema.validate_columns(). `valid` has a flag for each row, and `failures` maps
+    each column that failed to the rows it failed for. Constraints that fail for whole rows, like
+    required, are in `failures` under their own name.
+    """
+
+    def __init__(self, schema, valid, failures):
+        self.schema = schema
+        self.valid = valid
+        self.failures = failures
+
+    def __bool__(self):
+        return not self.failures
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rows={len(self.valid)}, failures={list(self.failures)})"
+
+    def failed(self):
+        """Returns the rows that failed, in order."""
+        return [i for i, ok in enumerate(self.valid) if not ok]
+
+
 class ConstraintKeyError(RuntimeWarning):
     """The constraint was not found in the environment"""
 
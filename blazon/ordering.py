@@ -0,0 +1,106 @@
+"""
+  Adaptive ordering of a schema's is_valid() checks, see Environment.adaptive. Checks are sorted so
+  the ones that reject the most for the least time run first. Only the validate-only paths are
+  reordered, conversion always runs the constraints in the schema's own order.
+"""
+
+from time import perf_counter
+
+### One call in this many is timed, check by check.
+SAMPLE_EVERY = 16
+
+### The checks are sorted again after this many timed calls.
+SAMPLES_PER_SORT = 32
+
+
+def adaptive_checks(schema, constraints):
+    """Returns AdaptiveChecks for the compiled constraints, or None if the env isn't adaptive."""
+    if not schema.env.adaptive:
+        return None
+    return AdaptiveChecks(schema, constraints)
+
+
+class AdaptiveChecks:
+    """
+    Samples how long each of a schema's checks takes and how often it fails, and every so often
+    publishes the checks to the schema, as `schema.checks`, sorted by time over failure rate. The
+    type check always stays first, the others expect the type to be right. Stats are approximate
+    when many threads share the schema, which is fine for sorting.
+    """
+
+    def __init__(self, schema, constraints):
+        self.schema = schema
+        self.pairs = [(name, handler.is_valid) for name, handler in constraints.items()]
+        self.pinned = 1 if "type" in constraints else 0
+        self.stats = {name: [0, 0, 0.0] for name, _ in self.pairs}  # calls, failures, seconds
+        self.countdown = SAMPLE_EVERY
+        self.samples = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.order()!r})"
+
+    def due(self):
+        """Whether this call should be timed."""
+        self.countdown -= 1
+        if self.countdown > 0:
+            return False
+        self.countdown = SAMPLE_EVERY
+        return True
+
+    def sample(self, instance, partial=False):
+        """
+        Like Schema.is_valid(), but times every check, and keeps going after a failure so each
+        check's failure rate is known.
+        """
+        valid = True
+        stats = self.stats
+        for i, (name, check) in enumerate(self.pairs):
+            start = perf_counter()
+            try:
+                ok = check(instance, partial)
+            except Exception as err:
+                if valid:
+                    raise  # It would have raised without sampling too.
+                if not isinstance(err, ValueError):
+                    break  # Without sampling we'd have stopped at the earlier failure.
+                ok = False
+            stat = stats[name]
+            stat[0] += 1
+            stat[2] += perf_counter() - start
+            if not ok:
+                stat[1] += 1
+                valid = False
+                if i < self.pinned:
+                    break  # The type is wrong, the rest would just be confused.
+
+        self.samples += 1
+        if self.samples % SAMPLES_PER_SORT == 0:
+            self.sort()
+        return valid
+
+    def cost(self, name):
+        calls, failures, seconds = self.stats[name]
+        if not calls:
+            return 0.0
+        # Expected time spent per rejection. Ones that never fail sort last, cheapest first.
+        return (seconds / calls) / (failures / calls + 1e-3)
+
+    def sort(self):
+        from .schema import compile_lock
+
+        pinned, rest = self.pairs[: self.pinned], self.pairs[self.pinned :]
+        self.pairs = pinned + sorted(rest, key=lambda pair: self.cost(pair[0]))
+        checks = tuple(check for _, check in self.pairs)
+        # If the schema was recompiled since we were made, its checks aren't ours to reorder.
+        with compile_lock:
+            if self.schema.adaptive is self:
+                self.schema.__dict__["checks"] = checks
+
+    def order(self):
+        """Returns the names of the constraints, in the order their checks run."""
+        return [name for name, _ in self.pairs]
+
+    def reset(self):
+        """Forgets the stats, the current order stays until the next sort."""
+        self.stats = {name: [0, 0, 0.0] for name, _ in self.pairs}
+        self.samples = 0
@@ -0,0 +1,100 @@
+"""
+  Validates big batches of instances on many cores at once. Each worker process gets the schema
+  once, when it starts, and keeps it compiled for every chunk of instances it's sent after that.
+  See ProcessPoolValidator.
+"""
+
+import os
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .helpers import BatchResult
+
+### How many instances are sent to a worker at a time.
+CHUNK_SIZE = 1000
+
+### The schema a worker process checks against, see start_worker().
+worker_schema = None
+
+
+def start_worker(schema):
+    global worker_schema
+    worker_schema = schema
+
+
+def run_chunk(instances, convert, partial):
+    if convert:
+        result = worker_schema.convert_many(instances, partial)
+    else:
+        result = worker_schema.validate_many(instances, partial)
+    return result.valid, result.errors, result.values
+
+
+class ProcessPoolValidator:
+    """
+    Runs Schema.validate_many() or convert_many() over a pool of worker processes:
+
+        >>> with ProcessPoolValidator(schema, workers=32) as pool:
+        ...     result = pool.validate_many(instances)
+
+    Instances are sent in chunks of `chunk_size`, and only a couple of chunks per worker are out at
+    once, so they can be streamed from anywhere, see map_chunks(). The schema, instances, results
+    and errors all have to be picklable.
+    """
+
+    def __init__(self, schema, workers=None, chunk_size=CHUNK_SIZE, mp_context=None):
+        self.schema = schema
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = ProcessPoolExecutor(
+            self.workers, mp_context=mp_context, initializer=start_worker, initargs=(schema,)
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.schema!r}, workers={self.workers})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown()
+
+    def map_chunks(self, instances, convert=False, partial=False):
+        """
+        Yields a BatchResult for each chunk of the instances, in order. Positions in each result
+        are within its chunk.
+        """
+        instances = iter(instances)
+        pending = deque()
+        while True:
+            while len(pending) < 2 * self.workers:
+                chunk = list(islice(instances, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(self.executor.submit(run_chunk, chunk, convert, partial))
+            if not pending:
+                return
+            valid, errors, values = pending.popleft().result()
+            yield BatchResult(self.schema, valid, errors, values)
+
+    def validate_many(self, instances, partial=False):
+        """Like Schema.validate_many(), but in parallel."""
+        return self.join(self.map_chunks(instances, False, partial))
+
+    def convert_many(self, instances, partial=False):
+        """Like Schema.convert_many(), but in parallel."""
+        return self.join(self.map_chunks(instances, True, partial), values=[])
+
+    def join(self, results, values=None):
+        valid = []
+        errors = {}
+        for result in results:
+            errors.update((len(valid) + i, err) for i, err in result.errors.items())
+            valid.extend(result.valid)
+            if values is not None:
+                values.extend(result.values)
+        return BatchResult(self.schema, valid, errors, values)
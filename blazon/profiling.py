@@ -0,0 +1,125 @@
+"""
+  Counters for where validation time goes, see Environment.set_profiling(). While profiling is on,
+  Schema.compile() wraps each of the handlers it stores in `schema.constraints`, and their
+  is_valid() checks, to count calls and failures and time them. With it off, nothing is wrapped, so
+  it costs nothing.
+"""
+
+import reprlib
+from functools import wraps
+from time import perf_counter
+
+from .helpers import hashish
+
+### What the counters hold, in order.
+FIELDS = ("calls", "failures", "total", "max")
+
+
+def schema_key(schema):
+    """Schemas are counted by name, anonymous ones by their structure."""
+    return schema.name or ("anonymous", hashish(schema.value))
+
+
+def schema_label(schema):
+    """How a schema is shown, anonymous ones by a short repr of their value."""
+    return schema.name or reprlib.repr(schema.value)
+
+
+class Profile:
+    """
+    Calls, failures, and total and max time in seconds, for each constraint of each schema that was
+    compiled while profiling was on, nested ones included. Times include the nested schemas the
+    constraint checks, e.g. the time for "properties" includes the time for each property's schema.
+    Generated code (Environment.generate_code) isn't counted.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.labels = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(constraints={len(self.counters)})"
+
+    def counter(self, schema, name):
+        key = schema_key(schema)
+        self.labels.setdefault(key, schema_label(schema))
+        return self.counters.setdefault((key, name), [0, 0, 0.0, 0.0])
+
+    def display_labels(self):
+        """
+        Returns {key: label} for the schemas. The reprs of anonymous schemas are cut short, so ones
+        that come out the same are numbered, rather than being shown as one.
+        """
+        result = {}
+        seen = {}
+        for key, label in self.labels.items():
+            seen[label] = seen.get(label, 0) + 1
+            result[key] = label if seen[label] == 1 else f"{label} ({seen[label]})"
+        return result
+
+    def wrap(self, schema, name, handler):
+        """Returns the handler, and its is_valid() check, wrapped to count into the profile."""
+        counter = self.counter(schema, name)
+        check = handler.is_valid
+
+        @wraps(handler)
+        def profiled(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return handler(*args, **kwargs)
+            except ValueError:
+                counter[1] += 1
+                raise
+            finally:
+                count(counter, perf_counter() - start)
+
+        def is_valid(instance, partial=False):
+            start = perf_counter()
+            try:
+                valid = check(instance, partial)
+            except Exception:
+                counter[1] += 1
+                raise
+            finally:
+                count(counter, perf_counter() - start)
+            if not valid:
+                counter[1] += 1
+            return valid
+
+        profiled.is_valid = is_valid
+        return profiled
+
+    def stats(self):
+        """Returns the counters as {schema: {constraint: {"calls": ..., ...}}}."""
+        labels = self.display_labels()
+        result = {}
+        for (key, name), counter in self.counters.items():
+            result.setdefault(labels[key], {})[name] = dict(zip(FIELDS, counter))
+        return result
+
+    def table(self, sort="total", limit=None):
+        """Returns the counters as a table, the constraints that took longest first."""
+        column = FIELDS.index(sort)
+        labels = self.display_labels()
+        rows = sorted(self.counters.items(), key=lambda item: item[1][column], reverse=True)
+        row = "{:<40} {:<20} {:>9} {:>9} {:>10} {:>9}"
+        lines = [row.format("schema", "constraint", "calls", "failures", "total ms", "max µs")]
+        for (key, name), (calls, failures, total, longest) in rows[:limit]:
+            label = labels[key]
+            if len(label) > 40:
+                label = label[:37] + "..."
+            total, longest = f"{total * 1e3:.2f}", f"{longest * 1e6:.1f}"
+            lines.append(row.format(label, name, calls, failures, total, longest))
+        return "\n".join(lines)
+
+    def reset(self):
+        """Zeroes the counters, profiling carries on."""
+        for counter in self.counters.values():
+            counter[:] = [0, 0, 0.0, 0.0]
+
+
+def count(counter, elapsed):
+    counter[0] += 1
+    counter[2] += elapsed
+    if elapsed > counter[3]:
+        counter[3] = elapsed
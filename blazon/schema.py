@@ -1,20 +1,44 @@
 import sys
-import hashlib
-import logging
+import threading
 from functools import wraps
-from typing import Any
+from typing import Any, Iterable, Mapping
 from collections import OrderedDict
-from shortuuid import uuid
 from dataclasses import dataclass, field, replace
 from .helpers import (
     Undefined,
     hashish,
     ValidationError,
     SchemaValidationResult,
+    BatchResult,
+    ColumnResult,
+    column_check,
+    column_values,
+    numeric_array,
     ConstraintNotApplicable,
     ConstraintFailure,
     ConstraintKeyError,
 )
+from .ordering import adaptive_checks
+
+
+### Held while lazy schemas finish compiling, see Schema.compile_lazily(), and while compiled state
+### is published, see Schema.publish()
+compile_lock = threading.RLock()
+
+
+def uuid():
+    """Default schema names, shortuuid is only imported once a schema needs one."""
+    from shortuuid import uuid
+
+    return uuid()
+
+
+def rebuild_schema(env, value, name, strict):
+    """Unpickles a schema, see Schema.__reduce__(). If the env has the same one, it's used."""
+    schema = env.schemas.get(name or hashish(value))
+    if schema is None or schema.value != value or schema.strict != strict:
+        schema = env.schema(value, name=name, strict=strict)
+    return schema
 
 
 def wrap_applicable_checker(constraint, handler):
@@ -27,6 +51,29 @@ def wrap_applicable_checker(constraint, handler):
     return wrapper
 
 
+def wrap_applicable_check(constraint, check, strict):
+    @wraps(check)
+    def is_valid(instance, partial=False):
+        if not constraint.is_applicable(instance):
+            return not strict
+        return check(instance, partial)
+
+    return is_valid
+
+
+def handler_check(handler):
+    """Builds an is_valid() check out of a handler that doesn't provide one itself."""
+
+    def is_valid(instance, partial=False):
+        try:
+            handler(instance, convert=False, partial=partial)
+        except ValueError:
+            return False
+        return True
+
+    return is_valid
+
+
 @dataclass(frozen=True)
 class Schema:
     """
@@ -49,6 +96,16 @@ class Schema:
     name: str = field(default_factory=uuid)
     type: Any = field(init=False)  # This is the type given by the 'type' constraint
     constraints: dict = field(default_factory=OrderedDict, init=False)
+    checks: tuple = field(default=(), init=False, repr=False, compare=False)
+    batches: tuple = field(default=(), init=False, repr=False, compare=False)  # See check_column()
+    adaptive: Any = field(default=None, init=False, repr=False, compare=False)  # blazon.ordering
+    generated: Any = field(default=None, init=False, repr=False, compare=False)
+    compiled: bool = field(default=False, init=False, repr=False, compare=False)
+    index: dict = field(default=None, init=False, repr=False, compare=False)  # See get()
+    lookups: dict = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.build_index()
 
     def __repr__(self) -> str:
         if self.name:
@@ -61,25 +118,54 @@ class Schema:
         else:
             return hashish(self.value)
 
+    def __reduce__(self):
+        # Compiled constraints are closures, which can't be pickled, so a schema is pickled as its
+        # environment and value, and compiled again when it's unpickled.
+        return rebuild_schema, (self.env, self.value, self.name, self.strict)
+
     def get(self, key, default=None):
-        normal = self.env.constraints.get_alias(key)
+        """
+        Returns the value of the given constraint, whatever way it's spelled, e.g.
+        `get("max_items")` finds "maxItems" in a JSON Schema. Lookups are served from an index that
+        is rebuilt by compile(), so compile again after changing the value.
+        """
+        try:
+            k = self.lookups[key]
+        except KeyError:
+            normal = self.env.constraints.get_alias(key)
+            k = self.lookups[key] = self.index.get(normal, Undefined)
+        if k is Undefined:
+            return default
+        return self.value.get(k, default)
+
+    def build_index(self) -> None:
+        index = {}
         for k in self.value.keys():
-            if self.env.inflection(k) == normal:
-                return self.value[k]
-        return default
+            index.setdefault(self.env.inflection(k), k)
+        self.__dict__.update(index=index, lookups={})
 
     def compile(self) -> None:
-        self.constraints.clear()
-
-        self.__dict__["type"] = Undefined
+        """
+        Compiles the constraints. They're built off to the side and published all at once, so other
+        threads can keep validating without a lock, and see either the old constraints or the new.
+        """
+        self.build_index()
+        constraints = OrderedDict()
+        schema_type = Undefined
+        profile = self.env.profile if self.env.profiling else None
 
         # Compile the type constraint first
         if "type" in self.value:
             type_constraint = self.env.get_constraint("type")
             # Special case for the type constraint, we also get back an expected type:
-            self.constraints["type"], self.__dict__["type"] = type_constraint(
-                self, self.value["type"]
-            )
+            handler, schema_type = type_constraint(self, self.value["type"])
+            if not hasattr(handler, "is_valid"):
+                handler.is_valid = handler_check(handler)
+            if not hasattr(handler, "batch"):
+                handler.batch = column_check(handler.is_valid)
+            if profile is not None:
+                handler = profile.wrap(self, "type", handler)
+            constraints["type"] = handler
 
         for k, v in self.value.items():
             if k == "type":
@@ -92,7 +178,7 @@ class Schema:
                 continue
 
             try:
-                if not constraint.is_applicable_type(self.type):
+                if not constraint.is_applicable_type(schema_type):
                     raise ConstraintNotApplicable(k)
 
                 handler = constraint(self, v)
@@ -108,13 +194,86 @@ class Schema:
             except Exception as e:
                 raise
 
-            if self.type is Undefined:
+            check = getattr(handler, "is_valid", None) or handler_check(handler)
+            batch = getattr(handler, "batch", None)
+            if schema_type is Undefined:
                 handler = wrap_applicable_checker(constraint, handler)
-
-            self.constraints[k] = handler
-
+                check = wrap_applicable_check(constraint, check, self.strict)
+                batch = None
+            handler.is_valid = check
+            handler.batch = batch or column_check(check)
+            if profile is not None:
+                handler = profile.wrap(self, k, handler)
+
+            constraints[k] = handler
+
+        self.publish(
+            type=schema_type,
+            constraints=constraints,
+            checks=tuple(c.is_valid for c in constraints.values()),
+            batches=tuple(c.batch for c in constraints.values()),
+            adaptive=adaptive_checks(self, constraints),
+            generated=None,
+            compiled=True,
+        )
         return self
 
+    def publish(self, **state) -> None:
+        """
+        Swaps in compiled state. It's a single dict update, so it's atomic under the GIL, and it's
+        done under the compile lock, so AdaptiveChecks.sort() can't put back stale checks.
+        """
+        # Hold onto the old state until after, so nothing is freed, and no finalizer or weakref
+        # callback can run another thread, in the middle of the update.
+        with compile_lock:
+            old = dict(self.__dict__)
+            self.__dict__.update(state)
+            del old
+
+    def compile_lazily(self) -> None:
+        """
+        Finishes compiling a schema that the environment left uncompiled (see Environment.lazy).
+        Safe to call from many threads, only one of them compiles.
+        """
+        with compile_lock:
+            if self.compiled:
+                return
+            compiled = self.compile()
+            if compiled is not self:
+                # The schema turned out to be a reference to another one, so become that one.
+                if not compiled.compiled:
+                    compiled.compile_lazily()
+                self.publish(
+                    value=compiled.value,
+                    strict=compiled.strict,
+                    index=compiled.index,
+                    lookups=compiled.lookups,
+                    type=compiled.type,
+                    constraints=compiled.constraints,
+                    checks=compiled.checks,
+                    batches=compiled.batches,
+                    adaptive=adaptive_checks(self, compiled.constraints),
+                    generated=None,
+                    compiled=True,
+                )
+
+    def generate(self):
+        """
+        Returns the generated code for this schema, see `blazon.codegen`. It's built the first time
+        it's asked for, and thrown away whenever the schema is compiled again.
+        """
+        if not self.compiled:
+            self.compile_lazily()
+        constraints, generated = self.constraints, self.generated
+        if generated is None:
+            from .codegen import generate
+
+            generated = generate(self)
+            # Unless it was compiled again while we were at it.
+            if self.constraints is constraints:
+                self.__dict__["generated"] = generated
+        return generated
+
     def copy(self, **changes) -> "Schema":
         clone = replace(self, **changes)
         clone.compile()
@@ -131,7 +290,7 @@ class Schema:
         else:
             err.path.insert(0, name)
 
-        if not err.message:
+        if not err.message and constraint.description:
             err.message = constraint.description.format(instance=instance, value=value)
 
         err.schema = self
@@ -139,6 +298,179 @@ class Schema:
         return err
 
     def validate(self, instance: Any, partial: bool = False) -> SchemaValidationResult:
+        if not self.compiled:
+            self.compile_lazily()
+        if self.env.generate_code and self.generate().validate(instance, partial):
+            return SchemaValidationResult(self, instance, {})
+        return self._validate(instance, partial)
+
+    def __call__(self, instance: Any, partial: bool = False) -> "Schema":  # WOW, FUCK, plugin?
+        if not self.compiled:
+            self.compile_lazily()
+        if self.env.generate_code:
+            return self.generate().convert(instance, partial)
+        return self._convert(instance, partial)
+
+    def is_valid(self, instance: Any, partial: bool = False) -> bool:
+        """
+        Like validate(), but only answers yes or no. It stops at the first constraint that fails and
+        doesn't build any errors along the way.
+        """
+        if not self.compiled:
+            self.compile_lazily()
+        if self.env.generate_code:
+            return self.generate().validate(instance, partial)
+        adaptive = self.adaptive
+        if adaptive is not None and adaptive.due():
+            return adaptive.sample(instance, partial)
+        for check in self.checks:
+            if not check(instance, partial):
+                return False
+        return True
+
+    def validate_many(self, instances: Iterable, partial: bool = False) -> BatchResult:
+        """
+        Validates each of the instances, see BatchResult. Instances are only run through the full
+        validate() when the cheaper is_valid() checks fail, so errors are built just for those.
+        """
+        if not self.compiled:
+            self.compile_lazily()
+        if self.env.generate_code:
+            checks = (self.generate().validate,)
+        elif self.adaptive is not None:
+            checks = (self.is_valid,)
+        else:
+            checks = self.checks
+        validate = self._validate
+
+        valid = []
+        errors = {}
+        for i, instance in enumerate(instances):
+            try:
+                for check in checks:
+                    if not check(instance, partial):
+                        break
+                else:
+                    valid.append(True)
+                    continue
+            except Exception:
+                pass
+            try:
+                result = validate(instance, partial)
+            except (ValueError, TypeError) as err:
+                # Like convert_many(), a constraint that blows up is that instance's error.
+                valid.append(False)
+                errors[i] = err
+                continue
+            valid.append(result.success)
+            if not result.success:
+                errors[i] = result
+        return BatchResult(self, valid, errors)
+
+    def convert_many(self, instances: Iterable, partial: bool = False) -> BatchResult:
+        """Converts each of the instances, see BatchResult. One failure doesn't stop the rest."""
+        if not self.compiled:
+            self.compile_lazily()
+        if self.env.generate_code:
+            convert = self.generate().convert
+        else:
+            convert = self._convert
+
+        valid = []
+        values = []
+        errors = {}
+        for i, instance in enumerate(instances):
+            try:
+                values.append(convert(instance, partial))
+                valid.append(True)
+            except (ValueError, TypeError) as err:
+                values.append(None)
+                valid.append(False)
+                errors[i] = err
+        return BatchResult(self, valid, errors, values)
+
+    def validate_columns(self, columns: Mapping, partial: bool = False) -> ColumnResult:
+        """
+        Validates a batch of rows that are held as columns, a mapping of each entry name to a list
+        or NumPy array of its values. It's like validating the dict for each row, but the entries
+        are checked a whole column at a time. See ColumnResult.
+        """
+        if not self.compiled:
+            self.compile_lazily()
+        lengths = set(len(column) for column in columns.values())
+        if len(lengths) > 1:
+            raise ValueError(f"columns must all be the same length, got lengths: {lengths!r}")
+        rows = lengths.pop() if lengths else 0
+
+        failures = {}
+        for name, handler in self.constraints.items():
+            if name == "type":
+                if not issubclass(dict, self.type):
+                    failures[name] = list(range(rows))
+                continue
+            check_columns = getattr(handler, "check_columns", None)
+            if check_columns is not None:
+                for key, failed in check_columns(name, columns, rows, partial).items():
+                    if failed:
+                        failures[key] = failed
+                continue
+            # Otherwise we have to check it row by row.
+            names = list(columns)
+            values = [column_values(column) for column in columns.values()]
+            failed = [
+                i
+                for i, row in enumerate(zip(*values))
+                if not handler.is_valid(dict(zip(names, row)), partial)
+            ]
+            if failed:
+                failures[name] = failed
+
+        valid = [True] * rows
+        for failed in failures.values():
+            for i in failed:
+                valid[i] = False
+        return ColumnResult(self, valid, failures)
+
+    def check_column(self, values: Iterable, partial: bool = False) -> list:
+        """
+        Returns a list with a flag for each of the values, whether it is valid. Each constraint is
+        checked for the whole column at once, and values are dropped as soon as they fail one.
+        """
+        if not self.compiled:
+            self.compile_lazily()
+        arr = numeric_array(values)
+        if arr is None:
+            values = column_values(values)
+            positions = range(len(values))
+        else:
+            positions = sys.modules["numpy"].arange(len(arr))
+        flags = [True] * len(values)
+
+        for batch in self.batches:
+            results = batch(values, partial)
+            if arr is not None:
+                keep = sys.modules["numpy"].asarray(results, dtype=bool)
+                if keep.all():
+                    continue
+                for i in positions[~keep].tolist():
+                    flags[i] = False
+                positions, values = positions[keep], values[keep]
+            else:
+                if all(results):
+                    continue
+                kept_positions, kept_values = [], []
+                for i, v, ok in zip(positions, values, results):
+                    if ok:
+                        kept_positions.append(i)
+                        kept_values.append(v)
+                    else:
+                        flags[i] = False
+                positions, values = kept_positions, kept_values
+            if not len(values):
+                break
+        return flags
+
+    def _validate(self, instance: Any, partial: bool = False) -> SchemaValidationResult:
         results = {}
 
         for name, c in self.constraints.items():
@@ -157,11 +489,11 @@ class Schema:
 
         return SchemaValidationResult(self, instance, results)
 
-    def __call__(self, instance: Any, partial: bool = False) -> "Schema":  # WOW, FUCK, plugin?
+    def _convert(self, instance: Any, partial: bool = False) -> Any:
         for name, c in self.constraints.items():
             try:
                 instance = c(instance, convert=True, partial=partial)
-            except ConstraintNotApplicable:
+            except ConstraintNotApplicable as err:
                 if self.strict:
                     raise self.build_error(name, err, instance)
             except (ValueError, AssertionError) as err:
@@ -4,10 +4,12 @@
 """
 
 import inspect
+from types import MemberDescriptorType
 from dataclasses import dataclass
 from typing import Dict, Type, Union, Any
 from abc import ABC
 from .schema import Schema, Undefined
+from .helpers import ValidationError
 from .environment import native
 
 
@@ -47,10 +49,28 @@ Schematic = None
 
 
 class SchematicType(type):
-    def __new__(cls, name, bases, namespace):
+    """
+    Builds the schema for each Schematic class. With `slots=True`, like `class Point(Schematic,
+    slots=True)`, fields are kept in __slots__ rather than a __dict__ per instance, which takes a
+    lot less memory. Attributes that aren't fields still go in a __dict__, made when one is set.
+    """
+
+    def __new__(cls, name, bases, namespace, slots=False):
+        defaults = {}
+        if slots and Schematic is not None:
+            namespace = dict(namespace)
+            names = slot_names(bases, namespace)
+            # A slot can't share its name with a class attribute, so defaults are kept aside.
+            defaults = {k: namespace.pop(k) for k in names if k in namespace}
+            extras = ("__dict__",) if all(b.__dictoffset__ == 0 for b in bases) else ()
+            namespace["__slots__"] = tuple(names) + extras
+
         new_cls = type.__new__(cls, name, bases, namespace)
         if Schematic is not None:
-            new_cls.__schema__ = build_schema(new_cls, namespace.get("__schema__"))
+            if slots:
+                members = {k: new_cls.__dict__[k] for k in names}
+                new_cls.__schema_slots__ = dict(new_cls.__schema_slots__, **members)
+            new_cls.__schema__ = build_schema(new_cls, namespace.get("__schema__"), defaults)
             if new_cls.__schema__:
                 new_cls.__schema_fields__ = build_fields(new_cls)
                 new_cls.__schema__.env.schematics[name] = new_cls
@@ -65,8 +85,10 @@ class Schematic(metaclass=SchematicType):
     Validate function
     """
 
+    __slots__ = ()  # Subclasses get a __dict__, unless they ask for slots.
     __schema__: Schema = None
     __schema_fields__: Dict[str, "Field"]
+    __schema_slots__: Dict[str, Any] = {}  # Slot descriptors, by field name
 
     def __init__(self, __value__=Undefined, **kwargs):
         super().__init__()
@@ -98,18 +120,255 @@ class Schematic(metaclass=SchematicType):
     def __post_init__(self):
         ...
 
+    @classmethod
+    def from_many(cls, rows, lazy=False):
+        """
+        Builds an instance for each of the rows, dicts of values, like `cls(row)` would, but quicker
+        for lots of them. Returns a list, or an iterator if `lazy`. Instances are built without
+        going through __init__, __post_init__ is still called. If the class has its own __init__
+        though, it's just `cls(row)` for each row.
+        """
+        instances = build_many(cls, rows)
+        return instances if lazy else list(instances)
+
+    @classmethod
+    def from_tuples(cls, rows, columns, lazy=False):
+        """Like from_many(), but each row is a tuple of values for the given columns, in order."""
+        columns = tuple(columns)
+        entries = cls.__schema__.get("entries", {})
+        for k in columns:
+            if k not in entries:
+                raise AttributeError(f"Unknown attribute: {k!r}")
+        instances = build_many(cls, (zip(columns, row) for row in rows))
+        return instances if lazy else list(instances)
+
     def set_value(self, value, partial=True):
-        self.__dict__.clear()
-        self.__dict__.update(self.__schema__(value, partial=partial))
+        value = self.__schema__(value, partial=partial)
+        clear_values(self)
+        store_values(self, value)
 
     def get_value(self, partial=True):
-        return self.__schema__(self.__dict__, partial=partial)
+        return self.__schema__(unwrap(self), partial=partial)
+
+    def get_raw_value(self):
+        """
+        Returns what's stored, as it is, without going through the schema. Without slots, this is
+        the instance's __dict__ itself. It isn't always plain data: a $ref field that has been read
+        holds the Schematic it was converted to, see RefDescriptor. Use unwrap() for plain dicts,
+        e.g. to serialize it, or get_value() for it converted by the schema.
+        """
+        slots = self.__schema_slots__
+        if not slots:
+            return self.__dict__
+        value = {}
+        for k, member in slots.items():
+            try:
+                value[k] = member.__get__(self)
+            except AttributeError:
+                pass
+        value.update(getattr(self, "__dict__", ()))
+        return value
 
     def validate(self, partial=False):
-        return self.__schema__.validate(self.__dict__, partial=partial)
+        return self.__schema__.validate(unwrap(self), partial=partial)
 
     def __setattr__(self, k, v):
-        self.__dict__.update(self.__schema__({k: v}, partial=True))
+        setter = field_setters(type(self)).get(k)
+        if setter is None:
+            store_values(self, self.__schema__({k: v}, partial=True))
+        else:
+            setter(self, v)
+
+
+### Constraints on the whole mapping that the field setters cover, for an instance that only has
+### fields in it, which is partial. See build_many().
+FIELD_CONSTRAINTS = {"type", "entries", "pattern_entries", "additional_entries", "required"}
+
+
+def build_many(cls, rows):
+    """
+    Yields an instance for each row, working out everything that's the same for each one first.
+    When the schema has nothing on the whole mapping that matters, each value is converted by its
+    field's own converter, see field_setters(), skipping the rest of the schema.
+    """
+    if cls.__init__ is not Schematic.__init__:
+        for row in rows:
+            yield cls(dict(row))
+        return
+
+    schema = cls.__schema__
+    if not schema.compiled:
+        schema.compile_lazily()
+    convert = schema.generate().convert if schema.env.generate_code else schema._convert
+    plan = None
+    if schema.constraints.keys() <= FIELD_CONSTRAINTS and schema.type in (Undefined, dict):
+        plan = {k: setter.convert for k, setter in field_setters(cls).items()}
+    defaults = schema.get("default", None)
+    slotted = bool(cls.__schema_slots__)
+    post_init = cls.__post_init__
+    if post_init is Schematic.__post_init__:
+        post_init = None
+    new = object.__new__
+
+    for row in rows:
+        if defaults:
+            value = dict(defaults)
+            value.update(row)
+        else:
+            value = dict(row)
+        if plan is not None and value.keys() <= plan.keys():
+            for k, v in value.items():
+                value[k] = plan[k](v)
+        else:
+            value = convert(value, True)
+        obj = new(cls)
+        if slotted:
+            store_values(obj, value)
+        else:
+            object.__setattr__(obj, "__dict__", value)
+        if post_init is not None:
+            post_init(obj)
+        yield obj
+
+
+### Setters, see field_setters() ###
+def field_setters(cls):
+    """
+    Returns {field: setter(obj, value)} for the class, where each setter converts and stores a value
+    for just that field, with the field's own schema. Setting an attribute only needs that,
+    constraints across fields, like `required`, `dependencies` or `all_of`, are left to validate().
+    They're built from the schema's compiled constraints, and built again if it's recompiled.
+    """
+    schema = cls.__schema__
+    if not schema.compiled:
+        schema.compile_lazily()
+    cached = cls.__dict__.get("__schema_setters__")
+    if cached is not None and cached[0] is schema.constraints:
+        return cached[1]
+    setters = build_setters(cls, schema)
+    cls.__schema_setters__ = (schema.constraints, setters)
+    return setters
+
+
+def build_setters(cls, schema):
+    entries = schema.constraints.get("entries")
+    if entries is None:
+        return {}
+    setters = {}
+    for k in entries.schema_map:
+        subschemas = []
+        for name, handler in schema.constraints.items():
+            if name == "entries":
+                subschemas.append((name, handler.schema_map[k]))
+            elif name == "pattern_entries":
+                subschemas.extend((name, sub) for sub in handler.pattern_map.lookup(k))
+        setters[k] = field_setter(schema, k, subschemas, cls.__schema_slots__.get(k))
+    return setters
+
+
+def field_setter(schema, k, subschemas, member=None):
+    """
+    Converts the value like the entries constraints would, with the same errors, then stores it.
+    The conversion alone is `setter.convert(value)`.
+    """
+
+    def convert(value):
+        if isinstance(value, Schematic):
+            value = value.get_raw_value()
+        for name, sub_schema in subschemas:
+            try:
+                value = sub_schema(value)
+            except ValidationError as err:
+                err.path.insert(0, "{" + k + "}")
+                raise schema.build_error(name, err, {k: value})
+            except (ValueError, AssertionError) as err:
+                raise schema.build_error(name, err, {k: value})
+        return value
+
+    def setter(obj, value):
+        if member is None:
+            obj.__dict__[k] = convert(value)
+        else:
+            member.__set__(obj, convert(value))
+
+    setter.convert = convert
+    return setter
+
+
+def unwrap(obj):
+    """
+    Returns a copy of what's stored, with the Schematics in it, like the ones RefDescriptor keeps,
+    turned back into plain dicts.
+    """
+    value = dict(obj.get_raw_value())
+    for k, v in value.items():
+        if isinstance(v, Schematic):
+            value[k] = unwrap(v)
+    return value
+
+
+### Storage, either the __dict__ or slots, see SchematicType ###
+def store_value(obj, k, v):
+    member = obj.__schema_slots__.get(k)
+    if member is None:
+        obj.__dict__[k] = v
+    else:
+        member.__set__(obj, v)
+
+
+def store_values(obj, value):
+    slots = obj.__schema_slots__
+    if not slots:
+        obj.__dict__.update(value)
+        return
+    for k, v in value.items():
+        member = slots.get(k)
+        if member is None:
+            obj.__dict__[k] = v
+        else:
+            member.__set__(obj, v)
+
+
+def clear_values(obj):
+    for member in obj.__schema_slots__.values():
+        try:
+            member.__delete__(obj)
+        except AttributeError:
+            pass
+    if hasattr(obj, "__dict__"):
+        obj.__dict__.clear()
+
+
+def clear_value(obj, k):
+    member = obj.__schema_slots__.get(k)
+    if member is None:
+        del obj.__dict__[k]
+    else:
+        member.__delete__(obj)
+
+
+def load_value(obj, k):
+    """Returns what's stored for the attribute, or Undefined."""
+    member = obj.__schema_slots__.get(k)
+    if member is None:
+        return getattr(obj, "__dict__", {}).get(k, Undefined)
+    try:
+        return member.__get__(obj)
+    except AttributeError:
+        return Undefined
+
+
+def slot_names(bases, namespace):
+    """The fields a class with slots=True will have, less those its bases already have slots for."""
+    names = [k for k in namespace.get("__annotations__", {}) if not k.startswith("__")]
+    for value in [namespace.get("__schema__")] + [getattr(b, "__schema__", None) for b in bases]:
+        if value:
+            names.extend(value.get("entries", None) or ())
+    taken = set()
+    for base in bases:
+        for klass in base.__mro__:
+            taken.update(getattr(klass, "__schema_slots__", ()))
+    return [k for k in dict.fromkeys(names) if k not in taken]
 
 
 def build_fields(cls):
@@ -123,11 +382,14 @@ def build_fields(cls):
 
     fields = {}
     for k, v in entries.items():
-        if v.get("default", Undefined) is not Undefined:
-            setattr(cls, k, v["default"])
+        default = v.get("default", Undefined)
         fields[k] = v
         if isinstance(v, dict) and "$ref" in v:
-            setattr(cls, k, RefDescriptor(k, v["$ref"].rsplit("/", 1)[-1]))
+            setattr(cls, k, RefDescriptor(k, v["$ref"].rsplit("/", 1)[-1], default))
+        elif k in cls.__schema_slots__:
+            setattr(cls, k, SlotDescriptor(k, default))
+        elif default is not Undefined:
+            setattr(cls, k, default)
 
     return fields
 
@@ -136,7 +398,7 @@ def schema_name_from_class(cls):
     return inspect.getmodule(cls).__name__.split(".", 1)[0] + "." + cls.__name__
 
 
-def build_schema(cls, value):
+def build_schema(cls, value, defaults=None):
     if isinstance(value, Schema):
         if not value.name:
             value = value.copy(name=schema_name_from_class(cls))
@@ -167,8 +429,8 @@ def build_schema(cls, value):
             entries[k] = {"type": list, "items": {"type": annotation[0]}}
         else:
             entries[k] = {"type": annotation}
-        v = getattr(cls, k, Undefined)
-        if v is Undefined:
+        v = defaults[k] if defaults and k in defaults else getattr(cls, k, Undefined)
+        if v is Undefined or isinstance(v, (SlotDescriptor, MemberDescriptorType)):
             continue
         if isinstance(v, Field):
             entries[k] = v.get_schema(env)
@@ -198,13 +460,46 @@ def build_schema(cls, value):
     return env.schema(name=name, value=value)
 
 
-class RefDescriptor:
-    def __init__(self, attribute_name, schema_name):
+class SlotDescriptor:
+    """A field of a Schematic with slots, it reads the slot and falls back to the default."""
+
+    def __init__(self, attribute_name, default=Undefined):
         self.attribute_name = attribute_name
+        self.default = default
+
+    def __get__(self, obj, type=None) -> Any:
+        if obj is None:
+            return self
+        value = load_value(obj, self.attribute_name)
+        if value is Undefined:
+            if self.default is Undefined:
+                raise AttributeError(self.attribute_name)
+            return self.default
+        return value
+
+    def __set__(self, obj, value) -> None:
+        Schematic.__setattr__(obj, self.attribute_name, value)
+
+    def __delete__(self, obj) -> None:
+        if load_value(obj, self.attribute_name) is Undefined:
+            raise AttributeError(self.attribute_name)
+        clear_value(obj, self.attribute_name)
+
+
+class RefDescriptor(SlotDescriptor):
+    """
+    A field that refers to another schema. If there's a Schematic for that schema, the value is
+    read as one, which is converted the first time and kept, so it's the same object after that.
+    """
+
+    def __init__(self, attribute_name, schema_name, default=Undefined):
+        super().__init__(attribute_name, default)
         self.schema_name = schema_name
 
     def __get__(self, obj, type=None) -> Any:
-        value = obj.__dict__.get(self.attribute_name, Undefined)
+        if obj is None:
+            return self
+        value = load_value(obj, self.attribute_name)
         if value is Undefined:
             raise AttributeError(self.attribute_name)
         schematic = obj.__schema__.env.schematics.get(self.schema_name)
@@ -212,10 +507,6 @@ class RefDescriptor:
             return value
         if isinstance(value, schematic):
             return value
-        return schematic(value)
-
-    def __set__(self, obj, value) -> None:
-        obj.__dict__.update(obj.__schema__({self.attribute_name: value}, partial=True))
-
-    def __delete__(self, obj) -> None:
-        del obj.__dict__[self.attribute_name]
+        value = schematic(value)
+        store_value(obj, self.attribute_name, value)
+        return value
@@ -0,0 +1,188 @@
+"""
+  Reads the items out of a big JSON document a piece at a time, so they can be validated without
+  ever holding the whole thing in memory. Handles a top-level JSON array, or newline-delimited JSON
+  (NDJSON), from a file path or a binary or text stream. See JSONEnvironment.stream().
+"""
+
+import os
+import json
+import codecs
+from itertools import chain
+from collections import namedtuple
+
+### How much we read at a time.
+CHUNK_SIZE = 64 * 1024
+
+### Yielded for each item that doesn't validate, or for an NDJSON line that can't be parsed.
+StreamError = namedtuple("StreamError", "index error")
+
+whitespace = " \t\n\r"
+number_chars = "0123456789+-.eE"
+decoder = json.JSONDecoder()
+
+
+def iter_json(source, chunk_size=CHUNK_SIZE):
+    """
+    Yields the items of a JSON array, or the records of NDJSON, from the given path or stream. An
+    NDJSON record that can't be parsed is yielded as a StreamError, everything else is yielded as
+    it's parsed.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield from iter_json(stream, chunk_size)
+        return
+
+    chunks = read_chunks(source, chunk_size)
+    for first in chunks:
+        start = first.lstrip(whitespace)
+        if start:
+            break
+    else:
+        return
+
+    if start[0] == "[":
+        yield from iter_array(start, chunks)
+    else:
+        yield from iter_lines(start, chunks)
+
+
+def check_items(schema, items, convert=True):
+    """
+    Yields each of the items converted by the schema, or as it is if `convert` is False. Items that
+    fail, and StreamErrors already in the items, are yielded as StreamErrors.
+    """
+    for index, item in enumerate(items):
+        if isinstance(item, StreamError):
+            yield item
+        elif convert:
+            try:
+                item = schema(item)
+            except (ValueError, TypeError) as err:
+                item = StreamError(index, err)
+            yield item
+        else:
+            result = schema.validate(item)
+            yield item if result else StreamError(index, result)
+
+
+def read_chunks(stream, chunk_size):
+    """Yields text from the stream, decoding it as utf-8 if it's binary."""
+    decode = None
+    while True:
+        raw = stream.read(chunk_size)
+        chunk = raw
+        if isinstance(raw, bytes):
+            if decode is None:
+                decode = codecs.getincrementaldecoder("utf-8-sig")().decode
+            chunk = decode(raw, final=not raw)
+        if chunk:
+            yield chunk
+        if not raw:
+            return
+
+
+def iter_lines(start, chunks):
+    index = 0
+    parts = []
+    for chunk in chain([start], chunks):
+        if "\n" not in chunk:
+            parts.append(chunk)
+            continue
+        head, *lines, tail = chunk.split("\n")
+        for line in ["".join(parts) + head, *lines]:
+            if line.strip():
+                yield parse_line(index, line)
+                index += 1
+        parts = [tail]
+    line = "".join(parts)
+    if line.strip():
+        yield parse_line(index, line)
+
+
+def parse_line(index, line):
+    try:
+        return json.loads(line)
+    except ValueError as err:
+        return StreamError(index, err)
+
+
+def iter_array(buffer, chunks):
+    pos = 1  # Just past the opening bracket.
+    index = 0
+    done = False
+    expect_item = True
+
+    while True:
+        # Skip whitespace and commas, reading more as we need it.
+        while True:
+            while pos < len(buffer) and buffer[pos] in whitespace:
+                pos += 1
+            if pos < len(buffer) or done:
+                break
+            buffer, pos = buffer[pos:], 0
+            buffer, done = read_more(buffer, chunks)
+
+        if pos >= len(buffer):
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+        if buffer[pos] == "]":
+            if expect_item and index:
+                raise json.JSONDecodeError("Expecting value", buffer, pos)  # Like `[1,]`
+            check_end(buffer, pos + 1, chunks)
+            return
+        if not expect_item:
+            if buffer[pos] != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            expect_item = True
+            continue
+
+        # Parse the next item. If it fails, or it's a number that could still be going on past the
+        # end of the buffer, we read more and try again. We at least double what we have each time,
+        # so a huge item isn't parsed over and over.
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as err:
+                if done or not truncated(err):
+                    raise
+            else:
+                if done or not may_continue(item, buffer, end):
+                    break
+            buffer, pos = buffer[pos:], 0
+            target = 2 * len(buffer)
+            while not done and len(buffer) < target:
+                buffer, done = read_more(buffer, chunks)
+
+        yield item
+        index += 1
+        pos = end
+        expect_item = False
+
+
+def check_end(buffer, pos, chunks):
+    """Makes sure there's nothing but whitespace after the array, like json.loads() would."""
+    for text in chain([buffer[pos:]], chunks):
+        stripped = text.lstrip(whitespace)
+        if stripped:
+            raise json.JSONDecodeError("Extra data", text, len(text) - len(stripped))
+
+
+def may_continue(item, buffer, end):
+    """Whether the item could go on past the end of the buffer, like a number cut off at `1.5e`."""
+    if end == len(buffer):
+        return True
+    if isinstance(item, (int, float)) and not isinstance(item, bool):
+        return not buffer[end:].lstrip(number_chars)
+    return False
+
+
+def truncated(err):
+    """Whether the decode error could just be from the document being cut off at the buffer end."""
+    return err.msg.startswith("Unterminated string") or err.pos >= len(err.doc) - 8
+
+
+def read_more(buffer, chunks):
+    """Returns the buffer with the next chunk on the end of it, and whether there's no more."""
+    for chunk in chunks:
+        return buffer + chunk, False
+    return buffer, True
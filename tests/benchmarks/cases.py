@@ -0,0 +1,186 @@
+"""
+  The benchmark cases. Each one is set up once, and returns the function to time. Cases with
+  modes are timed once validating and once converting.
+"""
+
+import io, os, json as _json
+import yaml
+from blazon import Schematic, field
+from ..helpers import json_env
+
+here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("validate", "convert")
+
+
+def timed(schema, mode, instance):
+    if mode == "validate":
+        return lambda: schema.validate(instance)
+    return lambda: schema(instance)
+
+
+### Schemas and instances ###
+def wide(count=500, distinct=False):
+    kinds = [
+        ({"type": "integer", "minimum": 0}, 7),
+        ({"type": "string", "maxLength": 20}, "seven"),
+        ({"type": "number", "maximum": 100}, 7.5),
+        ({"type": "boolean"}, True),
+    ]
+    properties = {f"field{i}": kinds[i % 4][0] for i in range(count)}
+    if distinct:
+        # Nothing for the environment to share between them.
+        properties = {k: dict(v, description=k) for k, v in properties.items()}
+    instance = {f"field{i}": kinds[i % 4][1] for i in range(count)}
+    return {"type": "object", "required": list(properties)[:50], "properties": properties}, instance
+
+
+def deep(depth=50):
+    value = {"type": "object", "properties": {"value": {"type": "integer"}}}
+    instance = {"value": 0}
+    for level in range(1, depth):
+        value = {
+            "type": "object",
+            "required": ["child"],
+            "properties": {"value": {"type": "integer", "minimum": 0}, "child": value},
+        }
+        instance = {"value": level, "child": instance}
+    return value, instance
+
+
+def big_array(count=10000):
+    item = {
+        "type": "object",
+        "required": ["id"],
+        "properties": {"id": {"type": "integer"}, "name": {"type": "string", "minLength": 1}},
+    }
+    instance = [{"id": i, "name": f"user{i}"} for i in range(count)]
+    return {"type": "array", "items": item, "maxItems": count}, instance
+
+
+def numbers(count=10000):
+    value = {"type": "array", "items": {"type": "number", "minimum": 0, "maximum": 1e6}}
+    return value, [float(i) for i in range(count)]
+
+
+def pattern_map(patterns=20, keys=200):
+    value = {
+        "type": "object",
+        "patternProperties": {
+            f"^p{i}_[a-z]+$": {"type": "integer", "minimum": i} for i in range(patterns)
+        },
+        "additionalProperties": False,
+    }
+    instance = {f"p{i % patterns}_{'k' * (1 + i // patterns)}": 100 for i in range(keys)}
+    return value, instance
+
+
+def one_of(variants=8, count=200):
+    options = [
+        {
+            "type": "object",
+            "required": ["kind"],
+            "properties": {"kind": {"const": f"kind{i}"}, f"value{i}": {"type": "integer"}},
+        }
+        for i in range(variants)
+    ]
+    instance = [{"kind": f"kind{i % variants}", f"value{i % variants}": i} for i in range(count)]
+    return {"type": "array", "items": {"oneOf": options}}, instance
+
+
+def swagger_text():
+    with open(os.path.join(here, "schemas", "swagger.yaml")) as file:
+        return _json.dumps(yaml.safe_load(file))
+
+
+def swagger(env=None):
+    env = env or json_env()
+    return env.from_file(io.StringIO(swagger_text()), type="json", name="Swagger")
+
+
+def petstore():
+    with open(os.path.join(here, "data", "petstore.yaml")) as file:
+        return yaml.safe_load(file)
+
+
+### Cases ###
+def case_schema(build):
+    def setup(mode):
+        value, instance = build()
+        return timed(json_env().schema(value), mode, instance)
+
+    return setup
+
+
+def setup_swagger(mode):
+    return timed(swagger(), mode, petstore())
+
+
+class Member(Schematic):
+    name: str
+    age: int = field(default=42, minimum=0)
+    email: str = field(default="", format="email")
+    tags: list = field(default_factory=list)
+
+
+class SlottedMember(Schematic, slots=True):
+    name: str
+    age: int = field(default=42, minimum=0)
+    email: str = field(default="", format="email")
+    tags: list = field(default_factory=list)
+
+
+def setup_schematic_init(mode):
+    return lambda: Member(name="Bob", age=67, email="bob@example.com", tags=["a", "b"])
+
+
+def setup_schematic_from_many(mode):
+    rows = [{"name": f"Bob {i}", "age": i % 90, "email": "bob@example.com"} for i in range(1000)]
+    return lambda: Member.from_many(rows)
+
+
+def setup_schematic_set(mode):
+    person = Member(name="Bob")
+
+    def run():
+        person.name = "Robert"
+        person.age = 68
+        person.email = "robert@example.com"
+
+    return run
+
+
+def setup_compile_wide(mode):
+    value, _ = wide()
+    return lambda: json_env().schema(value)
+
+
+def setup_compile_swagger(mode):
+    text = swagger_text()
+    return lambda: json_env().from_file(io.StringIO(text), type="json", name="Swagger")
+
+
+### name -> (setup, modes)
+CASES = {
+    "wide": (case_schema(wide), MODES),
+    "deep": (case_schema(deep), MODES),
+    "big_array": (case_schema(big_array), MODES),
+    "numbers": (case_schema(numbers), MODES),
+    "pattern_map": (case_schema(pattern_map), MODES),
+    "one_of": (case_schema(one_of), MODES),
+    "swagger_petstore": (setup_swagger, MODES),
+    "schematic_init": (setup_schematic_init, ("run",)),
+    "schematic_from_many": (setup_schematic_from_many, ("run",)),
+    "schematic_set": (setup_schematic_set, ("run",)),
+    "compile_wide": (setup_compile_wide, ("run",)),
+    "compile_swagger": (setup_compile_swagger, ("run",)),
+}
+
+
+def benchmarks(select=None):
+    """Yields (name, mode, setup) for each benchmark, or only those with `select` in them."""
+    for name, (setup, modes) in CASES.items():
+        for mode in modes:
+            key = f"{name}[{mode}]"
+            if select is None or select in key:
+                yield key, mode, setup
@@ -0,0 +1,112 @@
+"""
+  Memory measurements, with tracemalloc, for compiled schemas and Schematic instances:
+
+    python -m tests.benchmarks.memory
+
+  With BLAZON_BENCHMARKS=1, test_memory.py fails when one goes over its budget in BUDGETS. Budgets
+  can be scaled with BLAZON_MEMORY_BUDGET, e.g. 1.5 for 50% more room. Needs Python 3.9 or later.
+"""
+
+import io, gc, os, tracemalloc
+from .cases import json_env, swagger, swagger_text, petstore, wide, Member, SlottedMember
+
+### In bytes, per call or per instance where it says so. About half again what they were measured
+### at on Python 3.11, the retained ones are there to catch leaks.
+BUDGETS = {
+    "swagger_schema": 1600000,
+    "wide_schema_1000": 5000000,
+    "schematic_instance": 4096,
+    "schematic_100k_per_instance": 512,
+    "slotted_100k_per_instance": 336,
+    "call_transient": 300000,
+    "call_retained": 64,
+    "validate_transient": 256000,
+    "validate_retained": 64,
+}
+
+SCALE = float(os.environ.get("BLAZON_MEMORY_BUDGET", 1))
+
+
+def retained(build):
+    """Returns how many bytes are still allocated after build(), while its result is kept."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def per_call(fn, calls=100):
+    """
+    Returns the bytes allocated at the peak of a call to fn, and the bytes still held after each
+    call, averaged over many. fn is called once before, so caches are warm.
+    """
+    fn()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        for _ in range(calls):
+            fn()
+        gc.collect()
+        held = (tracemalloc.get_traced_memory()[0] - base) / (calls + 1)
+    finally:
+        tracemalloc.stop()
+    return peak, held
+
+
+def measure():
+    text = swagger_text()
+    results = {
+        "swagger_schema": retained(lambda: json_env().from_file(io.StringIO(text), type="json")),
+        "wide_schema_1000": retained(lambda: json_env().schema(wide(1000, distinct=True)[0])),
+    }
+
+    def one():
+        return Member(name="Bob", age=67, email="bob@example.com", tags=["a", "b"])
+
+    results["schematic_instance"] = retained(one)
+    many = retained(lambda: [one() for _ in range(100000)])
+    results["schematic_100k_per_instance"] = many / 100000
+
+    def slotted():
+        return SlottedMember(name="Bob", age=67, email="bob@example.com", tags=["a", "b"])
+
+    many = retained(lambda: [slotted() for _ in range(100000)])
+    results["slotted_100k_per_instance"] = many / 100000
+
+    schema, instance = swagger(), petstore()
+    peak, held = per_call(lambda: schema(instance))
+    results["call_transient"], results["call_retained"] = peak, held
+    peak, held = per_call(lambda: schema.validate(instance))
+    results["validate_transient"], results["validate_retained"] = peak, held
+    return results
+
+
+def over_budget(results, scale=SCALE):
+    """Returns [(name, bytes, budget)] for each measurement over its budget."""
+    return [
+        (name, value, BUDGETS[name] * scale)
+        for name, value in results.items()
+        if value > BUDGETS[name] * scale
+    ]
+
+
+def main():
+    results = measure()
+    for name, value in results.items():
+        print(f"{name:<32} {value:>14,.0f} bytes   budget {BUDGETS[name] * SCALE:>14,.0f}")
+    return 1 if over_budget(results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""
+  Runs the benchmarks in cases.py, and compares them with the baseline in baseline.json:
+
+    python -m tests.benchmarks.runner                   # Fails if anything got slower
+    python -m tests.benchmarks.runner -k swagger        # Just the swagger ones
+    python -m tests.benchmarks.runner --save            # Records a new baseline
+
+  Times are also kept relative to a fixed calibration loop, and those are what's compared, so a
+  baseline recorded on one machine is roughly right on another. Still, record a new one when the
+  machine changes.
+"""
+
+import os, sys, json, time, timeit, platform, argparse
+from .cases import benchmarks
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+### How much slower than the baseline a benchmark can get before it fails, 0.25 is 25%.
+THRESHOLD = float(os.environ.get("BLAZON_BENCH_THRESHOLD", 0.25))
+
+
+def calibration_loop():
+    total = 0
+    items = {str(i): i for i in range(1000)}
+    for _ in range(20):
+        for key, value in items.items():
+            if isinstance(value, int) and len(key) < 4:
+                total += value
+    return total
+
+
+def measure(fn, repeat=5):
+    """Returns the best time for one call to fn, in seconds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(select=None, repeat=5, report=None):
+    calibration = measure(calibration_loop, repeat)
+    results = {}
+    for key, mode, setup in benchmarks(select):
+        results[key] = {"seconds": measure(setup(mode), repeat)}
+    # Again at the end, in case the machine was busy at the start.
+    calibration = min(calibration, measure(calibration_loop, repeat))
+    for key, result in results.items():
+        result["relative"] = result["seconds"] / calibration
+        if report:
+            report(key, result)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration": calibration,
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """Returns [(key, baseline, current, change)] for each benchmark that regressed too far."""
+    regressions = []
+    for key, result in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None:
+            continue
+        change = result["relative"] / before["relative"] - 1
+        if change > threshold:
+            regressions.append((key, before["relative"], result["relative"], change))
+    return regressions
+
+
+def load(path=BASELINE):
+    with open(path) as file:
+        return json.load(file)
+
+
+def save(current, path=BASELINE, select=None):
+    # Saving some of them keeps the baseline for the rest.
+    if select is not None and os.path.exists(path):
+        baseline = load(path)
+        baseline.update((k, v) for k, v in current.items() if k != "results")
+        baseline["results"].update(current["results"])
+        current = baseline
+    with open(path, "w") as file:
+        json.dump(current, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks.runner")
+    parser.add_argument("-k", dest="select", help="only run benchmarks with this in their name")
+    parser.add_argument("--save", action="store_true", help="record the results as the baseline")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file, json")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    baseline = load(args.baseline) if os.path.exists(args.baseline) else {"results": {}}
+
+    def report(key, result):
+        line = f"{key:<32} {result['seconds'] * 1e6:>12.1f}µs"
+        before = baseline["results"].get(key)
+        if before:
+            line += f" {result['relative'] / before['relative'] - 1:>+8.1%}"
+        print(line, flush=True)
+
+    current = run(args.select, args.repeat, report)
+    if args.save:
+        save(current, args.baseline, args.select)
+        return 0
+
+    regressions = compare(baseline, current, args.threshold)
+    for key, before, after, change in regressions:
+        print(f"REGRESSION {key}: {change:+.1%} (over {args.threshold:.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import os
+import pytest
+from .cases import benchmarks
+from . import runner
+
+
+@pytest.mark.parametrize("key, mode, setup", list(benchmarks()), ids=lambda x: x)
+def test_case_runs(key, mode, setup):
+    result = setup(mode)()
+    if mode == "validate":
+        assert result
+
+
+def test_compare(tmp_path):
+    baseline = {"results": {"a": {"relative": 1.0}, "b": {"relative": 2.0}}}
+    current = {"results": {"a": {"relative": 1.2}, "b": {"relative": 3.0}, "c": {"relative": 9}}}
+    assert runner.compare(baseline, current, threshold=0.25) == [("b", 2.0, 3.0, 0.5)]
+    assert runner.compare(baseline, current, threshold=0.1)[0][0] == "a"
+
+    path = str(tmp_path / "baseline.json")
+    runner.save(baseline, path)
+    runner.save({"calibration": 1, "results": {"b": {"relative": 4.0}}}, path, select="b")
+    assert runner.load(path)["results"] == {"a": {"relative": 1.0}, "b": {"relative": 4.0}}
+
+
+def test_run():
+    current = runner.run("schematic_set", repeat=1)
+    assert list(current["results"]) == ["schematic_set[run]"]
+    assert current["results"]["schematic_set[run]"]["relative"] > 0
+
+
+@pytest.mark.skipif(
+    not os.environ.get("BLAZON_BENCHMARKS"), reason="set BLAZON_BENCHMARKS=1 to check timings"
+)
+def test_no_regressions():
+    regressions = runner.compare(runner.load(), runner.run())
+    assert not regressions, "\n".join(
+        f"{key}: {change:+.1%} over the baseline" for key, _, _, change in regressions
+    )
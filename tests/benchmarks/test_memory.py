@@ -0,0 +1,33 @@
+import os, sys
+import pytest
+from . import memory
+
+
+@pytest.fixture(scope="module")
+def results():
+    return memory.measure()
+
+
+# The budgets are what they are on the Python they were measured on, and tracemalloc.reset_peak()
+# needs 3.9 or later.
+@pytest.mark.skipif(
+    not os.environ.get("BLAZON_BENCHMARKS"), reason="set BLAZON_BENCHMARKS=1 to check memory"
+)
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="needs tracemalloc.reset_peak()")
+@pytest.mark.parametrize("name", list(memory.BUDGETS))
+def test_memory_budget(results, name):
+    budget = memory.BUDGETS[name] * memory.SCALE
+    assert results[name] <= budget, f"{name}: {results[name]:,.0f} bytes, budget {budget:,.0f}"
+
+
+def test_over_budget():
+    results = {"swagger_schema": 10 ** 9, "call_retained": 0}
+    assert memory.over_budget(results) == [
+        ("swagger_schema", 10 ** 9, memory.BUDGETS["swagger_schema"] * memory.SCALE)
+    ]
+    assert memory.over_budget(results, scale=10 ** 4) == []
+
+
+def test_retained():
+    assert memory.retained(lambda: bytearray(100000)) >= 100000
+    assert memory.retained(lambda: None) < 1000
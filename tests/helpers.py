@@ -0,0 +1,22 @@
+import blazon
+from blazon.environments.json_schema import JSONEnvironment, json_constraints
+
+
+def json_env(name="testJsonSchema", **kw):
+    """A fresh JSON Schema environment, with its own primitives so tests can't change blazon.json."""
+    return JSONEnvironment(
+        name=name,
+        inflection=blazon.json.inflection,
+        strict=False,
+        constraints=json_constraints,
+        primitives=dict(blazon.json.primitives),
+        **kw,
+    )
+
+
+def outcome(fn, instance):
+    """The result of fn(instance), or the type and message of the ValueError it raised."""
+    try:
+        return fn(instance)
+    except ValueError as err:
+        return type(err), str(err)
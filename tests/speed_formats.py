@@ -0,0 +1,54 @@
+import pytest
+import blazon
+from blazon.constraints.formats import get_format
+
+### A value that passes and one that doesn't, per format.
+samples = {
+    "date-time": ("1980-06-16T10:15:23-04:00", "1980-06-16 noonish"),
+    "date": ("1980-06-16", "06/16/1980"),
+    "time": ("10:15:23-04:00", "10:15"),
+    "email": ("brantley@example.com", "brantley at example"),
+    "hostname": ("api.eu-west.example.com", "-bad-.example.com"),
+    "ipv4": ("192.168.10.254", "192.168.010.254"),
+    "ipv6": ("2001:db8:85a3::8a2e:370:7334", "2001:db8:85a3::8a2e::7334"),
+    "uri": ("https://example.com/users/42?tab=profile#bio", "example.com/users/42"),
+    "uri-reference": ("/users/42?tab=profile", "/users/{42}"),
+    "iri": ("https://例え.jp/ユーザー/42", "例え.jp"),
+    "iri-reference": ("ユーザー/42#bio", "ユーザー/<42>"),
+}
+
+
+@pytest.mark.parametrize("name", samples)
+def test_format_valid(benchmark, name):
+    check, (valid, invalid) = get_format(name), samples[name]
+    assert check(valid)
+    benchmark(check, valid)
+
+
+@pytest.mark.parametrize("name", samples)
+def test_format_invalid(benchmark, name):
+    check, (valid, invalid) = get_format(name), samples[name]
+    assert not check(invalid)
+    benchmark(check, invalid)
+
+
+def test_format_profile(benchmark):
+    s = blazon.json.schema(
+        {
+            "type": "object",
+            "properties": {
+                "email": {"type": "string", "format": "email"},
+                "homepage": {"type": "string", "format": "uri"},
+                "last_ip": {"type": "string", "format": "ipv4"},
+                "host": {"type": "string", "format": "hostname"},
+            },
+        }
+    )
+    profile = {
+        "email": "brantley@example.com",
+        "homepage": "https://example.com/~brantley",
+        "last_ip": "10.0.0.12",
+        "host": "brantley.example.com",
+    }
+    assert s.validate(profile)
+    benchmark(s.validate, profile)
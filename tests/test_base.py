@@ -65,3 +65,17 @@ def test_const():
 def test_wrong_primitive():
     with pytest.raises(ValueError):
         blazon.schema({"type": "wrong"})
+
+
+def test_get():
+    s = blazon.json.schema({"maxItems": 3, "additionalProperties": False})
+
+    assert s.get("max_items") == 3
+    assert s.get("maxItems") == 3
+    assert s.get("additional_entries") is False
+    assert s.get("min_items") is None
+    assert s.get("min_items", 0) == 0
+
+    s.value["minItems"] = 1
+    s.compile()
+    assert s.get("min_items") == 1
@@ -0,0 +1,85 @@
+import pytest
+import blazon
+from blazon.helpers import BatchResult
+
+
+@pytest.fixture
+def user_schema():
+    return blazon.json.schema(
+        {
+            "type": "object",
+            "required": ["name"],
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "number", "minimum": 0, "default": 42},
+            },
+        }
+    )
+
+
+users = [{"name": "Bob"}, {"age": 3.0}, {"name": "Drew", "age": -1.0}, {"name": "Ann", "age": 7.0}]
+
+
+def test_validate_many(user_schema):
+    result = user_schema.validate_many(users)
+
+    assert isinstance(result, BatchResult)
+    assert not result
+    assert len(result) == 4
+    assert result.valid == [True, False, False, True]
+    assert result.failed() == [1, 2]
+    for i, err in result.errors.items():
+        assert not err
+        assert str(err) == str(user_schema.validate(users[i]))
+
+    assert user_schema.validate_many(iter(users[::3]))
+    assert user_schema.validate_many(users[1:2], partial=True)
+
+
+def test_convert_many(user_schema):
+    result = user_schema.convert_many([dict(u) for u in users])
+
+    assert result.valid == [True, False, True, True]
+    assert result.values[0] == {"name": "Bob"}
+    assert result.values[1] is None
+    assert result.values[2] == {"name": "Drew", "age": 0}
+    assert isinstance(result.errors[1], blazon.ValidationError)
+
+
+def test_convert_many_type_error():
+    # int(None) raises TypeError, that's one bad item, not a bad batch.
+    result = blazon.json.schema({"type": "integer"}).convert_many([1, None, "3"])
+
+    assert result.valid == [True, False, True]
+    assert result.values == [1, None, 3]
+    assert isinstance(result.errors[1], TypeError)
+
+
+def test_batch_generated(user_schema):
+    env = user_schema.env
+    env.generate_code = True
+    try:
+        assert user_schema.validate_many(users).valid == [True, False, False, True]
+        assert user_schema.convert_many([dict(u) for u in users]).valid == [True, False, True, True]
+    finally:
+        env.generate_code = False
+
+
+def test_validate_many_type_error():
+    constraints = blazon.native.constraints.clone()
+
+    def small(schema, value):
+        def handler(instance, convert=False, partial=False):
+            if instance > value:  # TypeError for None
+                raise blazon.ValidationError("too big")
+            return instance
+
+        return handler
+
+    constraints.add(small)
+    s = blazon.environment.Environment(name="small", constraints=constraints).schema({"small": 5})
+
+    result = s.validate_many([1, None, 9])
+    assert result.valid == [True, False, False]
+    assert isinstance(result.errors[1], TypeError)
+    assert not result.errors[2]
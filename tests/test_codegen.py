@@ -0,0 +1,132 @@
+import os, pytest, yaml
+import blazon
+
+from blazon import ValidationError
+from blazon.environment import Environment
+from . import helpers
+
+
+@pytest.fixture
+def env():
+    return Environment(name="generated", generate_code=True)
+
+
+@pytest.fixture
+def json_env():
+    return helpers.json_env(generate_code=True)
+
+
+CASES = [
+    ({"type": int, "minimum": 0, "maximum": 10}, [5, -5, 50, "7", "x", None]),
+    ({"minimum": 0, "exclusive_minimum": True}, [0, 1, "x"]),
+    ({"type": str, "min_length": 2, "max_length": 4, "pattern": "^a"}, ["ab", "abcdef", "b", 1]),
+    ({"enum": ["a", "b"]}, ["a", "c"]),
+    ({"const": 5}, [5, 4]),
+    ({"multiple-of": 3}, [9, 10, 2.5]),
+    ({"items": {"type": int, "maximum": 4}}, [[1, 2], [1, 9], ["1", "x"], []]),
+    ({"items": [{"const": 1}, {"const": 2}]}, [[1, 2], [1, 3]]),
+    ({"max_items": 2, "min_items": 1}, [[], [1], [1, 2, 3], (1, 2, 3)]),
+    ({"allOf": [{"type": str, "max_length": 3}, {"type": int, "maximum": 5}]}, ["666---", "1"]),
+    ({"anyOf": [{"type": int, "maximum": 4}, {"type": str}]}, [10, "asdf", 1]),
+    ({"if": {"maximum": 4}, "then": {"multiple-of": 2}, "else": {"multiple-of": 3}}, [2, 3, 9]),
+    (
+        {
+            "type": dict,
+            "entries": {
+                "name": {"type": str, "min_length": 3},
+                "age": {"type": int, "minimum": 18, "maximum": 130},
+                "tags": {"type": list, "items": {"type": str}},
+            },
+            "required": ["name"],
+        },
+        [
+            {"name": "bob", "age": 41},
+            {"name": "bob", "age": "41", "tags": [1, 2]},
+            {"name": "?", "age": 14},
+            {"age": 400},
+            {},
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("value, instances", CASES)
+def test_generated_matches_constraint_loop(env, value, instances):
+    s = env.schema(value)
+    for instance in instances:
+        for partial in (False, True):
+            expected = bool(s._validate(instance, partial=partial))
+            assert s.generate().validate(instance, partial) is expected
+            assert bool(s.validate(instance, partial=partial)) is expected
+
+            try:
+                expected = s._convert(_copy(instance), partial=partial)
+            except Exception as e:
+                with pytest.raises(type(e)):
+                    s(_copy(instance), partial=partial)
+            else:
+                assert s(_copy(instance), partial=partial) == expected
+
+
+def test_source(env):
+    s = env.schema({"type": int, "maximum": 5})
+    assert "isinstance" in s.generate().source
+    assert s.generate() is s.generate()
+
+    s.compile()
+    assert s.generated is None
+
+
+def test_errors_are_the_same(env):
+    s = env.schema({"entries": {"age": {"type": int, "maximum": 5}}, "required": ["age"]})
+
+    with pytest.raises(ValidationError) as info:
+        s({})
+    assert "required" in str(info.value)
+
+    result = s.validate({"age": "x"})
+    assert not result
+    assert "entries" in dict(result.items())
+
+
+def test_swagger(json_env):
+    root = os.path.dirname(__file__)
+    swagger = json_env.from_file(os.path.join(root, "schemas", "swagger.yaml"), name="Swagger")
+    with open(os.path.join(root, "data", "petstore.yaml")) as o:
+        petstore = yaml.safe_load(o)
+
+    assert swagger.validate(petstore)
+    assert swagger.generate().validate(petstore)
+    assert not swagger.generate().validate(dict(petstore, openapi=4))
+    assert swagger(_copy(petstore)) == swagger._convert(_copy(petstore))
+
+
+def _copy(instance):
+    if isinstance(instance, dict):
+        return {k: _copy(v) for k, v in instance.items()}
+    if isinstance(instance, list):
+        return [_copy(v) for v in instance]
+    return instance
+
+
+def test_custom_constraint_without_check():
+    constraints = blazon.native.constraints.clone()
+
+    def even(schema, value):
+        def handler(instance, convert=False, partial=False):
+            if instance % 2:
+                raise blazon.ValidationError
+            return instance
+
+        return handler
+
+    constraints.add(even, description="must be even", require=[int])
+    env = Environment(name="generatedCustom", constraints=constraints, generate_code=True)
+
+    s = env.schema({"even": True})
+    assert s.generate().validate(2)
+    assert not s.generate().validate(3)
+    assert not s.is_valid("x")
+    assert s.validate(4)
+    assert not s.validate(5)
+    assert s(6) == 6
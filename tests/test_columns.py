@@ -0,0 +1,95 @@
+import random
+import pytest
+import blazon
+from blazon.helpers import ColumnResult
+
+user_schema = {
+    "type": "object",
+    "required": ["name", "age"],
+    "properties": {
+        "name": {"type": "string", "minLength": 2, "maxLength": 8, "pattern": "^[A-Z]"},
+        "age": {"type": "integer", "minimum": 0, "maximum": 130},
+        "score": {"type": "number", "minimum": 0, "exclusiveMinimum": True, "multipleOf": 0.5},
+        "role": {"enum": ["admin", "user"]},
+        "email": {"type": "string", "format": "email"},
+        "anything": {"minimum": 3},
+    },
+}
+
+
+def make_columns(rows, seed=3):
+    rng = random.Random(seed)
+    return {
+        "name": [rng.choice(["Ann", "bob", "C", "Dorothea-Jane", "Eve", 7]) for _ in range(rows)],
+        "age": [rng.choice([0, 41, -1, 200, 99, 3.5]) for _ in range(rows)],
+        "score": [rng.choice([0.5, 0.0, 2.25, 10.0, 1.5]) for _ in range(rows)],
+        "role": [rng.choice(["admin", "user", "root"]) for _ in range(rows)],
+        "email": [rng.choice(["a@example.com", "nope"]) for _ in range(rows)],
+        "anything": [rng.choice([1, 5, "x", None]) for _ in range(rows)],
+    }
+
+
+def rows_of(columns):
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def check_matches_rows(schema, columns, partial=False):
+    result = schema.validate_columns(columns, partial=partial)
+    assert isinstance(result, ColumnResult)
+    expected = [bool(schema.validate(row, partial=partial)) for row in rows_of(columns)]
+    assert result.valid == expected
+    assert bool(result) == all(expected)
+    return result
+
+
+def test_validate_columns():
+    s = blazon.json.schema(user_schema)
+    columns = make_columns(500)
+    result = check_matches_rows(s, columns)
+
+    assert not result
+    assert len(result) == 500
+    schema_map = s.constraints["properties"].schema_map
+    for name, failed in result.failures.items():
+        for i in failed:
+            assert not schema_map[name].validate(columns[name][i])
+
+
+def test_validate_columns_required():
+    s = blazon.json.schema(user_schema)
+    columns = make_columns(20)
+    del columns["age"]
+
+    result = check_matches_rows(s, columns)
+    assert result.failures["required"] == list(range(20))
+    assert "required" not in check_matches_rows(s, columns, partial=True).failures
+
+
+def test_validate_columns_row_fallback():
+    s = blazon.json.schema(dict(user_schema, additionalProperties=False, maxProperties=6))
+    columns = make_columns(50)
+    check_matches_rows(s, columns)
+    columns["extra"] = [1] * 50
+    result = check_matches_rows(s, columns)
+    assert result.failures["additionalProperties"] == list(range(50))
+
+
+def test_validate_columns_lengths():
+    s = blazon.json.schema(user_schema)
+    with pytest.raises(ValueError):
+        s.validate_columns({"name": ["Ann"], "age": []})
+    assert s.validate_columns({})
+
+
+def test_validate_columns_numpy():
+    np = pytest.importorskip("numpy")
+    s = blazon.json.schema(user_schema)
+    columns = make_columns(200)
+    columns["age"] = [age if isinstance(age, int) else 5 for age in columns["age"]]
+    arrays = dict(columns, age=np.array(columns["age"]), score=np.array(columns["score"]))
+
+    # Arrays are checked as the python values they hold
+    assert s.validate_columns(arrays).valid == s.validate_columns(columns).valid
+    assert s.validate_columns(arrays).failures == s.validate_columns(columns).failures
+    assert s.validate_columns({"name": ["Ann"], "age": np.array([1.0])}).failures == {"age": [0]}
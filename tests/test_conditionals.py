@@ -1,3 +1,4 @@
+import pytest
 import blazon
 
 
@@ -62,6 +63,16 @@ def test_one_of():
     assert not s.validate(10)
 
 
+def test_one_of_duplicate_branches():
+    # Equal branches are shared as one Schema, but they're still two matches.
+    s = blazon.json.schema({"oneOf": [{"type": "integer"}, {"type": "integer"}]})
+
+    assert not s.validate(5)
+    assert not s.is_valid(5)
+    with pytest.raises(ValueError):
+        s(5)
+
+
 def test_not():
     s = blazon.schema({"not": {"type": int}})
 
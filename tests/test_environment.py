@@ -0,0 +1,141 @@
+import os, gc, threading, yaml
+import blazon
+
+from blazon.environment import Environment, SchemaRegistry
+from .helpers import json_env
+from blazon.helpers import structural_key
+
+
+def test_shared_subschemas():
+    env = Environment(name="shared")
+    s = env.schema({"entries": {"a": {"type": str}, "b": {"type": str}, "c": {"type": int}}})
+
+    schema_map = s.constraints["entries"].schema_map
+    assert schema_map["a"] is schema_map["b"]
+    assert schema_map["a"] is not schema_map["c"]
+
+    # The same structure in another schema is shared too
+    other = env.schema({"items": {"type": str}})
+    assert other.constraints["items"].additional_items is schema_map["a"]
+
+
+def test_structural_key():
+    assert structural_key({"type": "string"}) == structural_key({"type": "string"})
+    assert structural_key({"const": 1}) != structural_key({"const": True})
+    assert structural_key({"const": 1}) != structural_key({"const": 1.0})
+    assert structural_key({"enum": [1, 2]}) != structural_key({"enum": (1, 2)})
+
+
+def test_unhashable_subschemas():
+    env = Environment(name="unhashable")
+
+    class Unhashable:
+        __hash__ = None
+
+    s = env.schema({"entries": {"a": {"const": Unhashable()}}})
+    assert s.constraints["entries"].schema_map["a"] is not None
+
+
+def test_weak_registry():
+    env = Environment(name="weak", schemas=SchemaRegistry(anonymous="weak"))
+    named = env.schema({"type": int}, name="Named")
+    s = env.schema({"type": str, "max_length": 3})
+
+    assert len(env.schemas) == 2
+    del s
+    gc.collect()
+
+    assert env.get_named_schemas() == {"Named": named}
+    assert env.schemas.stats() == {"named": 1, "anonymous": 0, "evictions": 1}
+
+
+def test_lru_registry():
+    env = Environment(name="lru", schemas=SchemaRegistry(anonymous=3))
+    env.schema({"type": int}, name="Named")
+    for i in range(10):
+        env.schema({"const": i})
+
+    assert len(env.schemas.anonymous) == 3
+    assert env.schemas.evictions == 7
+    assert "Named" in env.schemas
+
+    env.schemas.set_anonymous(1)
+    assert len(env.schemas.anonymous) == 1
+    assert "Named" in env.schemas
+
+
+def test_lazy_subschemas():
+    env = Environment(name="lazy", lazy=True)
+    s = env.schema({"entries": {"a": {"type": int, "maximum": 5}, "b": {"type": str}}})
+
+    schema_map = s.constraints["entries"].schema_map
+    assert s.compiled
+    assert not schema_map["a"].compiled
+    assert not schema_map["b"].compiled
+
+    assert s.validate({"a": 4})
+    assert schema_map["a"].compiled
+    assert not schema_map["b"].compiled
+
+    assert s({"a": "10"}) == {"a": 5}
+    assert not s.is_valid({"a": 6})
+
+
+def test_lazy_threads():
+    env = Environment(name="lazy-threads", lazy=True)
+    s = env.schema({"items": {"type": int, "minimum": 0}})
+    results = []
+
+    def work():
+        results.append(s.is_valid([1, 2, 3]) and not s.is_valid([1, -2]))
+
+    threads = [threading.Thread(target=work) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 16
+
+
+def test_lazy_references():
+    root = os.path.dirname(__file__)
+    env = json_env(lazy=True)
+    swagger = env.from_file(os.path.join(root, "schemas", "swagger.yaml"), name="Swagger")
+    with open(os.path.join(root, "data", "petstore.yaml")) as o:
+        petstore = yaml.safe_load(o)
+
+    assert swagger.validate(petstore)
+    assert not swagger.is_valid(dict(petstore, info={"title": 1}))
+
+
+def test_inflection_memo():
+    from blazon.helpers import memoize_inflection, inflection_stats, underscore
+
+    assert memoize_inflection(underscore) is underscore
+    assert blazon.native.inflection is underscore
+    assert blazon.native.constraints.inflection is underscore
+
+    before = inflection_stats()["blazon.helpers.underscore"]["hits"]
+    blazon.schema({"max-items": 3, "min-items": 1})
+    blazon.schema({"max-items": 3, "min-items": 1})
+    assert inflection_stats()["blazon.helpers.underscore"]["hits"] > before
+
+
+def test_inflection_memo_lifetime():
+    import gc
+    from blazon.helpers import memoize_inflection, inflection_stats
+
+    first, second = (lambda word: word.lower()), (lambda word: word.upper())
+    memo = memoize_inflection(first)
+    assert memoize_inflection(first) is memo
+    assert memoize_inflection(memo) is memo
+    memoize_inflection(second)("x")
+    names = [name for name in inflection_stats() if "<lambda>" in name]
+    assert len(names) >= 2 and len(set(names)) == len(names)
+
+    # The memo goes with the function, nothing else keeps it.
+    count = len(inflection_stats())
+    del first, second, memo
+    gc.collect()
+    assert len(inflection_stats()) == count - 2
@@ -1,3 +1,4 @@
+import sys
 import pytest
 import blazon
 
@@ -105,3 +106,41 @@ def test_iri():
     s = blazon.schema({"type": str, "format": "iri-reference"})
 
     assert s.validate("urn:place/sub")
+
+
+def test_format_prefilters():
+    s = blazon.schema({"type": str, "format": "ipv4"})
+    assert not s.validate("127.0.0.01")
+    assert not s.validate("127.0.0.1\n")
+    assert not s.validate("1.2.3")
+
+    s = blazon.schema({"type": str, "format": "ipv6"})
+    assert not s.validate("127.0.0.1")
+    assert s.validate("::ffff:127.0.0.1")
+
+    s = blazon.schema({"type": str, "format": "hostname"})
+    assert s.validate("example.com.")
+    assert not s.validate("")
+    assert not s.validate("a..b")
+    assert not s.validate("a" * 64 + ".com")
+    assert not s.validate("a." * 128)
+
+    s = blazon.schema({"type": str, "format": "uri"})
+    assert not s.validate("http://example.com/a b")
+    assert not s.validate("http://example.com/%zz")
+
+
+def test_missing_rfc3987_warns_once(monkeypatch, caplog):
+    from blazon.constraints.formats import rfc3987_match
+
+    monkeypatch.setitem(sys.modules, "rfc3987", None)
+    rfc3987_match.cache_clear()
+    try:
+        s = blazon.schema({"type": str, "format": "uri"})
+        for _ in range(3):
+            assert s.validate("urn:isbn:0451450523")
+        assert not s.validate("not a uri")
+    finally:
+        rfc3987_match.cache_clear()
+
+    assert len([r for r in caplog.records if "rfc3987" in r.message]) == 1
@@ -0,0 +1,90 @@
+import pytest
+import blazon
+
+from blazon.schema import Schema
+
+
+CASES = [
+    ({"type": int}, [1, "1", None]),
+    ({"enum": ["bob", "carol"]}, ["bob", "jane"]),
+    ({"const": 5}, [5, 4]),
+    ({"multiple-of": 2}, [4, 3]),
+    ({"maximum": 5}, [4, 5, 6, "x"]),
+    ({"minimum": 0, "exclusive_minimum": True}, [0, 1]),
+    ({"type": str, "max-length": 3, "min-length": 2, "pattern": "^a"}, ["ab", "a", "abcd", "bb"]),
+    ({"items": {"const": 5}}, [[5, 5], [5, 1], []]),
+    ({"items": [{"const": 1}, {"const": 2}], "additional-items": False}, [[1, 2], [1, 2, 3], [1]]),
+    ({"max-items": 2, "min-items": 1, "unique-items": True}, [[1], [1, 1], [], [1, 2, 3]]),
+    ({"contains": {"const": 1}}, [[1, 2], [2, 3]]),
+    ({"required": ["a", "b"], "max-entries": 2}, [{"a": 1, "b": 2}, {"a": 1}, {"a", "b", "c"}]),
+    (
+        {
+            "entries": {"name": {"type": str}},
+            "patternEntries": {r"review-(\d+)": {"type": int}},
+            "additionalEntries": {"type": list},
+        },
+        [{"name": "carol", "review-1": 4, "x": []}, {"name": 1}, {"x": 4}, {"review-1": "4"}],
+    ),
+    ({"dependencies": {"card": ["address"]}}, [{}, {"card": 1}, {"card": 1, "address": 2}]),
+    ({"entryNames": {"type": str, "min_length": 3}}, [{"foo": 1}, {"x": 1}]),
+    ({"if": {"maximum": 4}, "then": {"multiple-of": 2}, "else": {"multiple-of": 3}}, [2, 3, 9, 8]),
+    ({"allOf": [{"type": str, "max_length": 6}, {"type": str, "min_length": 3}]}, ["foo", "f"]),
+    ({"anyOf": [{"type": int, "maximum": 4}, {"type": str}]}, [1, 10, "x"]),
+    ({"oneOf": [{"type": int, "maximum": 4}, {"type": int, "multiple-of": 4}]}, [1, 4, 5, 8]),
+    ({"not": {"type": int}}, ["foo", 2]),
+    ({"type": str, "format": "email"}, ["a@example.com", "a@a"]),
+]
+
+
+@pytest.mark.parametrize("value, instances", CASES)
+def test_is_valid_matches_validate(value, instances):
+    s = blazon.schema(value)
+    for instance in instances:
+        for partial in (False, True):
+            assert s.is_valid(instance, partial=partial) is bool(s.validate(instance, partial))
+
+
+def test_partial():
+    s = blazon.schema({"required": ["a"]})
+    assert not s.is_valid({})
+    assert s.is_valid({}, partial=True)
+
+
+def test_no_errors_built(monkeypatch):
+    s = blazon.json.schema(
+        {
+            "type": "object",
+            "properties": {"age": {"type": "integer", "minimum": 0}},
+            "required": ["age"],
+        }
+    )
+
+    def build_error(*args, **kwargs):
+        raise AssertionError("is_valid() should not build errors")
+
+    monkeypatch.setattr(Schema, "build_error", build_error)
+
+    assert s.is_valid({"age": 1})
+    assert not s.is_valid({"age": -1})
+    assert not s.is_valid({})
+    assert not s.is_valid("nope")
+
+
+def test_custom_constraint_without_check():
+    constraints = blazon.native.constraints.clone()
+
+    def even(schema, value):
+        def handler(instance, convert=False, partial=False):
+            if instance % 2:
+                raise blazon.ValidationError
+            return instance
+
+        return handler
+
+    constraints.add(even, description="must be even", require=[int])
+    env = blazon.environment.Environment(name="custom", constraints=constraints)
+
+    s = env.schema({"even": True})
+    assert s.is_valid(2)
+    assert not s.is_valid(3)
+    assert not s.is_valid("x")
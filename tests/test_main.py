@@ -0,0 +1,54 @@
+import json
+from blazon.__main__ import main, percentile
+
+schema = """
+type: object
+required: [id]
+properties:
+  id: {type: integer}
+"""
+
+
+def lines(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_validate(tmp_path, capsys):
+    (tmp_path / "s.yaml").write_text(schema)
+    data = tmp_path / "data.ndjson"
+    data.write_text('{"id": 1}\n{"id": "2"}\n{"id": "x"}\n{"id": \n{"name": "4"}\n{"id": null}\n')
+
+    assert main(["validate", "--schema", str(tmp_path / "s.yaml"), str(data)]) == 1
+    out, err = capsys.readouterr()
+    assert lines(out) == [{"id": 1}, {"id": 2}]
+    *errors, summary = err.splitlines()
+    assert [e["index"] for e in map(json.loads, errors)] == [2, 3, 4, 5]
+    assert summary.startswith("6 records, 2 valid, 4 failed")
+    assert "records/s" in summary and "p50" in summary and "p99" in summary
+
+
+def test_validate_ok(tmp_path, capsys):
+    (tmp_path / "s.yaml").write_text(schema)
+    (tmp_path / "a.json").write_text('[{"id": 1}, {"id": 2}]')
+    (tmp_path / "b.yaml").write_text("- {id: 3}\n---\nid: 4\n")
+    output = tmp_path / "out.ndjson"
+
+    files = [str(tmp_path / "a.json"), str(tmp_path / "b.yaml")]
+    args = ["validate", "-s", str(tmp_path / "s.yaml"), "-o", str(output), *files]
+    assert main(args) == 0
+    assert lines(output.read_text()) == [{"id": i} for i in range(1, 5)]
+    assert "4 records, 4 valid, 0 failed" in capsys.readouterr().err
+
+
+def test_validate_broken(tmp_path, capsys):
+    (tmp_path / "s.yaml").write_text(schema)
+    (tmp_path / "a.json").write_text('[{"id": 1}, {"id"')
+    assert main(["validate", "-s", str(tmp_path / "s.yaml"), "-q", str(tmp_path / "a.json")]) == 2
+    assert main(["validate", "-s", str(tmp_path / "missing.yaml"), "-q", "-"]) == 2
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    assert percentile(list(range(100)), 50) == 50
+    assert percentile(list(range(100)), 99) == 99
+    assert percentile([7], 99) == 7
@@ -116,3 +116,39 @@ def test_property_names():
     assert s.validate({"foo": 1, "foobar": 2})
     assert not s.validate({"foo": 1, "foobar": 2, "x": 3})
     assert not s.validate({"x": 3})
+
+
+def test_pattern_map():
+    from blazon.constraints.maps import PatternMap
+
+    patterns = PatternMap([("^a", 1), ("b", 2), ("(x)(y)", 3)])
+    assert patterns.combined is not None
+    assert patterns.lookup("ab") == (1, 2)
+    assert patterns.lookup("ba") == (2,)
+    assert patterns.lookup("bxy") == (2, 3)
+    assert patterns.lookup("zzz") == ()
+    assert patterns.any("cab") and not patterns.any("c")
+
+    patterns.lookup("ab")
+    assert patterns.lookup.cache_info().hits == 1
+
+    # Numbered backreferences can't be combined, they are searched one by one.
+    patterns = PatternMap([("(a)\\1", 1), ("b", 2)])
+    assert patterns.combined is None
+    assert patterns.lookup("aab") == (1, 2)
+    assert patterns.lookup("ab") == (2,)
+
+
+def test_pattern_properties_overlapping():
+    s = blazon.schema(
+        {
+            "patternEntries": {"^label-": {"type": str}, "-id$": {"type": str, "min_length": 3},},
+            "additionalEntries": False,
+        }
+    )
+
+    assert s.validate({"label-id": "abc", "label-host": "x"})
+    assert not s.validate({"label-id": "x"})
+    assert not s.validate({"label-id": "abc", "other": 1})
+    assert s.is_valid({"label-id": "abc", "label-host": "x"})
+    assert not s.is_valid({"label-id": "x"})
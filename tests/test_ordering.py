@@ -0,0 +1,88 @@
+import pytest
+import blazon
+from blazon import ordering
+from .helpers import json_env, outcome
+
+
+email = {
+    "type": "string",
+    "pattern": r"^([a-z0-9]+[._-]?)*[a-z0-9]+@([a-z0-9]+\.)+[a-z]{2,}$",
+    "format": "email",
+    "maxLength": 12,
+}
+
+instances = ["averyveryverylongname@example.com"] * 8 + ["ab@cd.io", "nope", 7, None]
+
+
+def test_adaptive_order():
+    s = json_env(adaptive=True).schema(email)
+    assert json_env().schema(email).adaptive is None
+    assert s.adaptive.order() == ["type", "pattern", "format", "maxLength"]
+
+    calls = ordering.SAMPLE_EVERY * ordering.SAMPLES_PER_SORT
+    for instance in instances * (calls // len(instances) + 1):
+        s.is_valid(instance)
+
+    # The cheap check that fails most goes first, but the type check never moves.
+    assert s.adaptive.order()[:2] == ["type", "maxLength"]
+    assert s.checks == tuple(s.constraints[name].is_valid for name in s.adaptive.order())
+
+    # Conversion still goes in the schema's order.
+    assert list(s.constraints) == ["type", "pattern", "format", "maxLength"]
+
+    s.adaptive.reset()
+    assert all(stat == [0, 0, 0.0] for stat in s.adaptive.stats.values())
+
+
+def test_adaptive_results():
+    plain, adaptive = json_env().schema(email), json_env(adaptive=True).schema(email)
+    for _ in range(ordering.SAMPLE_EVERY * ordering.SAMPLES_PER_SORT // len(instances) + 1):
+        for instance in instances:
+            assert plain.is_valid(instance) == adaptive.is_valid(instance)
+            assert outcome(plain, instance) == outcome(adaptive, instance)
+        assert plain.validate_many(instances).valid == adaptive.validate_many(instances).valid
+
+
+def test_adaptive_compile():
+    s = json_env(adaptive=True).schema(email)
+    first = s.adaptive
+    s.compile()
+    assert s.adaptive is not first
+    assert s.adaptive.order() == list(s.constraints)
+
+
+def test_adaptive_stale_sort():
+    s = json_env(adaptive=True).schema(email)
+    stale = s.adaptive
+    s.compile()
+    checks = s.checks
+    stale.sort()  # Left over from before the recompile, mustn't undo it
+    assert s.checks is checks
+    s.adaptive.sort()
+    assert s.checks is not checks
+
+
+def test_adaptive_sampled_errors():
+    constraints = blazon.native.constraints.clone()
+
+    def boom(schema, value):
+        def handler(instance, convert=False, partial=False):
+            return instance
+
+        def is_valid(instance, partial=False):
+            if instance == 13:
+                raise RuntimeError("unlucky")
+            return True
+
+        handler.is_valid = is_valid
+        return handler
+
+    constraints.add(boom)
+    env = blazon.environment.Environment(name="boom", constraints=constraints, adaptive=True)
+    s = env.schema({"type": int, "boom": True})
+
+    # Sampled or not, every call raises the same.
+    for _ in range(2 * ordering.SAMPLE_EVERY):
+        with pytest.raises(RuntimeError):
+            s.is_valid(13)
+    assert not s.is_valid("x")
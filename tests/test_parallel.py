@@ -0,0 +1,76 @@
+import pickle
+import multiprocessing
+import pytest
+import inflection
+import blazon
+from blazon import environment
+from blazon.environment import Environment
+from blazon.parallel import ProcessPoolValidator
+
+user_schema = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {"id": {"type": "integer", "minimum": 0}, "name": {"type": "string"}},
+}
+
+
+def test_pickle_shared():
+    s = blazon.json.schema(user_schema)
+    assert pickle.loads(pickle.dumps(s)) is s
+    assert pickle.loads(pickle.dumps(blazon.json)) is blazon.json
+    assert pickle.loads(pickle.dumps(environment.native)) is environment.native
+
+    named = blazon.schema({"type": int, "minimum": 2}, name="PickledTwo")
+    assert pickle.loads(pickle.dumps(named)) is named
+
+
+def test_pickle_by_value():
+    env = Environment(name="pickled", inflection=inflection.underscore, lazy=True)
+    inner = env.schema({"type": "int", "maximum": 4}, name="Inner")
+    outer = env.schema({"type": "dict", "entries": {"a": inner}})
+    data = pickle.dumps(outer)
+
+    # Back where it came from, it's the same environment.
+    assert pickle.loads(data).env is env
+
+    # Somewhere else, it's rebuilt.
+    environment.pickled_environments.clear()
+    copy = pickle.loads(data)
+    assert copy.env is not env
+    assert copy.env.lazy and copy.env.name == "pickled"
+    assert list(copy.env.schemas.named) == ["Inner"]
+    assert copy({"a": "2"}) == {"a": 2}
+    assert not copy.validate({"a": 5})
+    assert pickle.loads(pickle.dumps(copy)).env is copy.env
+
+
+def test_pickle_errors():
+    s = blazon.json.schema(user_schema)
+    result = pickle.loads(pickle.dumps(s.validate({"id": -1})))
+    assert not result and result.schema is s and "properties" in result.errors
+    with pytest.raises(ValueError) as info:
+        s({"id": "x"})
+    assert str(pickle.loads(pickle.dumps(info.value))) == str(info.value)
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_process_pool(method):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"no {method} start method")
+    s = blazon.json.schema(user_schema)
+    instances = [{"id": i % 50 - 1, "name": "x"} for i in range(1000)] + [{"id": "12"}, "nope"]
+
+    context = multiprocessing.get_context(method)
+    with ProcessPoolValidator(s, workers=2, chunk_size=64, mp_context=context) as pool:
+        result = pool.validate_many(iter(instances))
+        expected = s.validate_many(instances)
+        assert result.valid == expected.valid
+        assert sorted(result.errors) == sorted(expected.errors)
+        assert all(not err for err in result.errors.values())
+
+        converted = pool.convert_many(instances)
+        assert converted.values == s.convert_many(instances).values
+        assert converted.failed() == s.convert_many(instances).failed()
+
+        assert [len(r) for r in pool.map_chunks(instances[:200])] == [64, 64, 64, 8]
+        assert len(pool.validate_many([])) == 0
@@ -0,0 +1,67 @@
+from .helpers import json_env
+
+
+user_schema = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {"id": {"type": "integer", "minimum": 0}, "name": {"type": "string"}},
+}
+
+
+def test_profiling():
+    env = json_env(profiling=True)
+    s = env.schema(user_schema, name="User")
+    for i in range(10):
+        s.validate({"id": i - 2, "name": "Ann"})
+        s.is_valid({"id": i - 2})
+    s({"id": 1})
+
+    stats = env.profile.stats()
+    assert stats["User"]["properties"]["calls"] == 21
+    assert stats["User"]["properties"]["failures"] == 4
+    assert stats["User"]["type"] == dict(stats["User"]["type"], calls=21, failures=0)
+    minimum = stats["{'minimum': 0, 'type': 'integer'}"]["minimum"]
+    assert minimum["calls"] == 21 and minimum["failures"] == 4
+    assert 0 < minimum["max"] <= minimum["total"]
+
+    table = env.profile.table(limit=3).splitlines()
+    assert len(table) == 4 and table[0].split()[:2] == ["schema", "constraint"]
+    assert table[1].split()[:2] == ["User", "properties"]
+
+    env.profile.reset()
+    assert env.profile.stats()["User"]["properties"]["calls"] == 0
+    s.is_valid({"id": 1})
+    assert env.profile.stats()["User"]["properties"]["calls"] == 1
+
+
+def test_set_profiling():
+    env = json_env()
+    s = env.schema(user_schema, name="User")
+    s.validate({"id": 1})
+    assert env.profile.stats() == {}
+    assert not hasattr(s.constraints["properties"], "__wrapped__")
+
+    env.set_profiling()
+    s.validate({"id": 1})
+    assert env.profile.stats()["User"]["required"]["calls"] == 1
+    assert s.constraints["properties"].check_columns
+
+    env.set_profiling(False)
+    assert not hasattr(s.constraints["properties"], "__wrapped__")
+    s.validate({"id": 1})
+    assert env.profile.stats()["User"]["required"]["calls"] == 1
+
+
+def test_profiling_similar_schemas():
+    # Their reprs are cut short to the same text, but they're counted apart.
+    env = json_env(profiling=True)
+    first = env.schema({"enum": list(range(100)) + [1000]})
+    second = env.schema({"enum": list(range(100)) + [2000]})
+    first.is_valid(1000)
+    second.is_valid(1)
+    second.is_valid(2)
+
+    stats = env.profile.stats()
+    assert len(stats) == 2
+    assert sorted(s["enum"]["calls"] for s in stats.values()) == [1, 2]
+    assert len(env.profile.table().splitlines()) == 3
@@ -152,3 +152,220 @@ def test_abstract_subclass():
     assert beatrice.validate()
 
     assert beatrice.hello() == "Hello Person(name='Beatrice')"
+
+
+def test_slots():
+    class Point(Schematic, slots=True):
+        x: int
+        y: int = 0
+        label: str = field(default="origin", repr=True)
+
+    assert Point.__schema__.value == {
+        "entries": {
+            "x": {"type": int},
+            "y": {"type": int, "default": 0},
+            "label": {"default": "origin"},
+        },
+        "__repr__": ["label"],
+        "required": ["x"],
+    }
+
+    p = Point(x="1")
+    assert p.x == 1
+    assert p.y == 0
+    assert p.label == "origin"
+    assert p.get_raw_value() == {"x": 1}
+    assert p.validate()
+    assert repr(p) == "Point(label='origin')"
+
+    p.y = "2"
+    assert p.y == 2
+    with pytest.raises(ValueError):
+        p.y = "asdf"
+
+    p.extra = 3  # Goes in the __dict__, like without slots
+    assert vars(p) == {"extra": 3}
+    assert p.get_raw_value() == {"x": 1, "y": 2, "extra": 3}
+
+    p.set_value({"y": 5})
+    assert p.get_raw_value() == {"y": 5}
+    with pytest.raises(AttributeError):
+        p.x
+    assert not p.validate()
+    assert p.validate(partial=True)
+
+    del p.y
+    assert "y" not in p.get_raw_value()
+
+
+def test_slots_subclass():
+    class Person(Schematic, slots=True):
+        name: str
+        age: int = field(default=42, minimum=0)
+
+    class Human(Person):
+        pronoun: str = "they"
+
+    class Slotted(Person, slots=True):
+        pronoun: str = "they"
+
+    assert Slotted.__slots__ == ("pronoun",)
+    assert set(Slotted.__schema_slots__) == {"name", "age", "pronoun"}
+
+    for cls in (Human, Slotted):
+        sam = cls(name="Sam")
+        assert sam.age == 42
+        assert sam.pronoun == "they"
+        sam.age = -1
+        assert sam.age == 0
+        assert sam.validate()
+        assert sam.get_value() == {"name": "Sam", "age": 0}
+
+
+def test_slots_nested():
+    json.schema({"properties": {"name": {"type": "string"}}}, name="SlotPet")
+
+    class SlotPet(Schematic, slots=True):
+        __schema__ = json.schemas["SlotPet"]
+
+    class Owner(Schematic, slots=True):
+        __schema__ = json.schema(
+            {"properties": {"pet": {"$ref": "#/definitions/SlotPet"}}}, name="SlotOwner"
+        )
+
+    owner = Owner(pet={"name": "Rex"})
+    assert isinstance(owner.pet, SlotPet)
+    assert owner.pet.name == "Rex"
+
+    owner.pet = SlotPet(name=3)
+    assert owner.validate()
+    assert owner.get_value() == {"pet": {"name": "3"}}
+
+
+def test_field_setters():
+    class Account(Schematic):
+        __schema__ = blazon.schema(
+            {
+                "entries": {
+                    "card": {"type": str},
+                    "billing": {"type": str},
+                    "count": {"type": int},
+                },
+                "pattern_entries": {"^c": {"max_length": 4}},
+                "dependencies": {"card": ["billing"]},
+            }
+        )
+
+    a = Account()
+    a.card = 123456  # Converted by both its entry and the pattern, but dependencies can wait
+    assert a.card == "1234"
+    assert not a.validate()
+    a.billing = "Here"
+    assert a.validate()
+
+    with pytest.raises(ValueError) as info:
+        Account().count = "x"
+    assert info.value.path[:2] == ["entries", "{count}"]
+
+    a.extra = 2  # Not a field, goes through the whole schema
+    assert a.extra == 2
+
+    setters = blazon.schematic.field_setters(Account)
+    assert set(setters) == {"card", "billing", "count"}
+    Account.__schema__.compile()
+    assert blazon.schematic.field_setters(Account) is not setters
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_from_many(slots):
+    class Person(Schematic, slots=slots):
+        name: str
+        age: int = field(default=42, minimum=0, type=int)
+
+        def __post_init__(self):
+            self.seen = True
+
+    rows = [{"name": "Bob", "age": "67"}, {"name": 2}, {"age": -1, "extra": "x"}]
+    people = Person.from_many(rows)
+    assert [p.get_raw_value() for p in people] == [Person(row).get_raw_value() for row in rows]
+    assert people[0].age == 67
+    assert people[1].age == 42
+    assert people[2].extra == "x"
+    assert all(p.seen for p in people)
+    assert rows[0] == {"name": "Bob", "age": "67"}
+
+    lazy = Person.from_many(iter(rows), lazy=True)
+    assert next(lazy).name == "Bob"
+    assert len(list(lazy)) == 2
+
+    people = Person.from_tuples([("Bob", "67"), ("Sam", 1)], columns=["name", "age"])
+    assert [(p.name, p.age) for p in people] == [("Bob", 67), ("Sam", 1)]
+
+    with pytest.raises(AttributeError):
+        Person.from_tuples([("Bob",)], columns=["nope"])
+
+    with pytest.raises(ValueError):
+        Person.from_many([{"name": "Bob"}, {"age": "x"}])
+
+
+def test_from_many_own_init():
+    class Person(Schematic):
+        name: str
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.ready = True
+
+    people = Person.from_many([{"name": "Bob"}, {"name": 2}])
+    assert [(p.name, p.ready) for p in people] == [("Bob", True), ("2", True)]
+    assert Person.from_tuples([("Sam",)], columns=["name"])[0].ready
+
+
+def test_from_many_whole_schema():
+    class Account(Schematic):
+        __schema__ = blazon.schema(
+            {
+                "entries": {"card": {"type": str}, "billing": {"type": str}},
+                "dependencies": {"card": ["billing"]},
+            }
+        )
+
+    # The dependencies are on the whole mapping, so rows go through the whole schema, like __init__.
+    assert Account.from_many([{"card": 1, "billing": 2}])[0].card == "1"
+    with pytest.raises(ValueError):
+        Account.from_many([{"card": 1}])
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_ref_cached(slots):
+    json.schema(
+        {"properties": {"name": {"type": "string"}}, "required": ["name"]}, name="CachedCustomer"
+    )
+
+    class CachedCustomer(Schematic, slots=slots):
+        __schema__ = json.schemas["CachedCustomer"]
+
+    class Order(Schematic, slots=slots):
+        __schema__ = json.schema(
+            {"properties": {"customer": {"$ref": "#/definitions/CachedCustomer"}}}, name="Order"
+        )
+
+    order = Order(customer={"name": "Bob"})
+    customer = order.customer
+    assert isinstance(customer, CachedCustomer)
+    assert order.customer is customer
+
+    assert order.get_raw_value()["customer"] is customer
+    assert blazon.schematic.unwrap(order) == {"customer": {"name": "Bob"}}
+
+    order.customer.name = "Robert"
+    assert order.get_value() == {"customer": {"name": "Robert"}}
+    assert order.validate()
+    assert order.customer is customer
+
+    del order.customer.name
+    assert not order.validate()
+
+    order.customer = {"name": "Sam"}
+    assert order.customer is not customer
+    assert order.customer.name == "Sam"
@@ -0,0 +1,42 @@
+import os, sys, subprocess
+
+### Generous by default, tighten it with BLAZON_IMPORT_BUDGET_MS where the machine is known.
+IMPORT_BUDGET_MS = float(os.environ.get("BLAZON_IMPORT_BUDGET_MS", 250))
+
+DEFERRED = [
+    "shortuuid",
+    "inflection",
+    "ipaddress",
+    "logging",
+    "rfc3987",
+    "yaml",
+    "blazon.environments.json_schema",
+]
+
+
+def run(code, *args):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, *args, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    return result
+
+
+def test_import_defers_optional_modules():
+    code = f"import sys, blazon; print([m for m in {DEFERRED!r} if m in sys.modules])"
+    assert run(code).stdout.strip() == "[]"
+
+
+def test_json_environment_on_first_use():
+    code = "import blazon; from blazon import json; print(blazon.json is json, json.name)"
+    assert run(code).stdout.strip() == "True jsonSchema"
+
+
+def test_import_time_budget():
+    stderr = run("import blazon", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (x.strip() for x in line.replace(":", "|", 1).split("|"))
+        if name == "blazon":
+            assert int(cumulative) / 1000 < IMPORT_BUDGET_MS
+            return
+    raise AssertionError("blazon missing from -X importtime output")
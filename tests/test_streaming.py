@@ -0,0 +1,77 @@
+import io, json
+import pytest
+import blazon
+from blazon.streaming import iter_json, StreamError
+
+schema = {"type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}}}
+
+items = [{"id": 12345678901234567890}, {"id": 1.5e-7}, {"id": -0.25}, [1, "two", {"x": None}]]
+items += [{"id": i, "name": 'ü ☃ "quoted" \\n', "tags": ["a"] * (i % 5)} for i in range(200)]
+items += [12345, "string", True, None, 3.14159]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_iter_json_array(chunk_size):
+    data = json.dumps(items, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json(io.BytesIO(data), chunk_size)) == items
+
+    data = json.dumps(items, indent=2)
+    assert list(iter_json(io.StringIO(data), chunk_size)) == items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 4096])
+def test_iter_json_lines(chunk_size):
+    data = "\n".join(json.dumps(x, ensure_ascii=False) for x in items) + "\n\n"
+    assert list(iter_json(io.BytesIO(data.encode("utf-8")), chunk_size)) == items
+
+    data = '{"id": 1}\n{"id": \n\n{"id": 3}'
+    results = list(iter_json(io.StringIO(data), chunk_size))
+    assert results[0] == {"id": 1}
+    assert isinstance(results[1], StreamError) and results[1].index == 1
+    assert results[2] == {"id": 3}
+
+
+def test_iter_json_edges():
+    assert list(iter_json(io.BytesIO(b""))) == []
+    assert list(iter_json(io.BytesIO(b"  []  "))) == []
+    assert list(iter_json(io.BytesIO(b"\xef\xbb\xbf[1, 2]"))) == [1, 2]
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json(io.BytesIO(b"[1, 2")))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json(io.BytesIO(b"[1 2]")))
+    assert list(iter_json(io.BytesIO(b"[1]\n\n"), chunk_size=1)) == [1]
+    for text in (b"[1,]", b"[1] x", b"[1]\n[2]"):  # Like json.loads()
+        for chunk_size in (1, 64):
+            with pytest.raises(json.JSONDecodeError):
+                list(iter_json(io.BytesIO(text), chunk_size))
+
+
+def test_iter_json_is_lazy():
+    class Endless:
+        reads = 0
+
+        def read(self, size):
+            self.reads += 1
+            return b'[{"id": 1}' if self.reads == 1 else b', {"id": 1}' * 100
+
+    stream = Endless()
+    for i, item in enumerate(iter_json(stream)):
+        if i == 10000:
+            break
+    assert stream.reads < 200
+
+
+def test_stream(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps([{"id": 1}, {"id": "two"}, {}, {"id": 4}, {"id": None}]))
+
+    results = list(blazon.json.stream(schema, str(path)))
+    assert results[0] == {"id": 1}
+    assert [r.index for r in results if isinstance(r, StreamError)] == [1, 2, 4]
+    assert isinstance(results[2].error, blazon.ValidationError)
+    assert results[3] == {"id": 4}
+    assert isinstance(results[4].error, TypeError)  # int(None), the stream still carries on
+
+    results = list(blazon.json.stream(schema, path, convert=False))
+    assert [r.index for r in results if isinstance(r, StreamError)] == [1, 2, 4]
+    assert not results[1].error
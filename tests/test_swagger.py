@@ -46,10 +46,11 @@ def test_from_file():
     # Now we access it with dots because info isn't a dict, it's an Info Schematic
     assert petstore.info.version == "0.0.1"
 
-    # Still the same 'value' as before
-    assert old_value == petstore.get_value()
+    # Still the same 'value' as before, but with the new info
+    new_value = dict(old_value, info={"title": "Swagger Petstore", "version": "0.0.1"})
+    assert new_value == petstore.get_value()
 
     # We can assign it as a dict, shows up as Info object
     petstore.info = {"title": "Swagger Petstore", "version": "0.0.1"}
-    assert old_value == petstore.get_value()
+    assert new_value == petstore.get_value()
     assert isinstance(petstore.info, Info)
@@ -0,0 +1,102 @@
+import sys
+import time
+import threading
+import pytest
+import blazon
+from numbers import Integral
+from blazon.environment import Environment, SchemaRegistry
+
+user_schema = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 0},
+        "name": {"type": "string", "maxLength": 5},
+    },
+}
+
+good = {"id": 1, "name": "Ann"}
+bad = [{"id": 1, "name": "Dorothea"}, {"id": "x"}, {"name": "Ann"}, "nope"]
+
+
+@pytest.fixture
+def switchy():
+    # Switch threads as often as we can, to shake out races.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(*targets, count=8):
+    errors = []
+
+    def run(target):
+        try:
+            target()
+        except BaseException as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run, args=(t,)) for t in targets for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+def test_compile_while_validating(switchy):
+    s = blazon.json.schema(user_schema)
+    deadline = time.monotonic() + 0.5
+
+    def recompile():
+        while time.monotonic() < deadline:
+            s.compile()
+
+    def check():
+        while time.monotonic() < deadline:
+            assert s.is_valid(good) and s.validate(good) and s(good) == good
+            for instance in bad:
+                assert not s.is_valid(instance)
+                assert not s.validate(instance)
+            for instance in bad[1:]:
+                with pytest.raises(ValueError):
+                    s(instance)
+
+    run_threads(recompile, check, count=3)
+
+
+def test_registry(switchy):
+    modes = [None, "weak", 16]
+    envs = [Environment(f"threads-{m}", schemas=SchemaRegistry(anonymous=m)) for m in modes]
+
+    def create():
+        for i in range(100):
+            for env in envs:
+                s = env.schema({"type": "int", "maximum": i % 40})
+                assert s.is_valid(i % 40) and not s.is_valid(i % 40 + 1)
+                list(env.schemas)
+                env.get_schema(hash(s))
+
+    run_threads(create)
+    assert envs[2].schemas.stats()["anonymous"] <= 16
+
+
+def test_recompile_schemas(switchy):
+    env = Environment(name="threads-primitives")
+    env.primitive("thing", int)
+    s = env.schema({"type": "thing", "minimum": 3}, name="Thing")
+    deadline = time.monotonic() + 0.5
+
+    def swap():
+        while time.monotonic() < deadline:
+            env.primitive("thing", Integral)
+            env.primitive("thing", int)
+
+    def check():
+        while time.monotonic() < deadline:
+            assert s.is_valid(5) and not s.is_valid(1) and not s.is_valid("5")
+            assert not s.validate(1) and s(5) == 5
+
+    run_threads(swap, check, count=3)
@@ -0,0 +1,74 @@
+import random
+import numbers
+import pytest
+import blazon
+from .helpers import json_env, outcome
+
+np = pytest.importorskip("numpy")
+
+
+schemas = [
+    {"type": "array", "items": {"type": "number", "minimum": 0, "maximum": 100}},
+    {"type": "array", "items": {"type": "number", "minimum": 0, "exclusiveMinimum": True}},
+    {"type": "array", "items": {"type": "integer", "multipleOf": 3, "maximum": 90}},
+    {"type": "array", "items": {"type": "integer", "minimum": 0.5}},
+]
+
+
+def samples():
+    rng = random.Random(7)
+    yield [rng.uniform(0, 100) for _ in range(1000)]
+    yield [rng.uniform(-5, 105) for _ in range(1000)]
+    yield [float(rng.randrange(0, 30) * 3) for _ in range(500)]
+    yield [rng.randrange(0, 30) * 3 for _ in range(500)]
+    yield [rng.randrange(-3, 100) for _ in range(500)]
+    yield [1, 2.5] * 200
+    yield [1.0] * 10
+    yield list(np.linspace(0, 100, 400))
+    yield [1, 2 ** 60] * 200
+    yield [0.5] * 300 + [2 ** 53 + 1]
+
+
+@pytest.mark.parametrize("value", schemas)
+def test_vectorized_matches_loop(value):
+    plain, vector = json_env().schema(value), json_env(vectorize=True).schema(value)
+
+    for instance in samples():
+        assert plain.is_valid(list(instance)) == vector.is_valid(list(instance))
+        assert bool(plain.validate(list(instance))) == bool(vector.validate(list(instance)))
+        assert outcome(plain, list(instance)) == outcome(vector, list(instance))
+
+
+def test_vectorized_mixed_numbers():
+    value = {"type": list, "items": {"type": numbers.Number, "maximum": 2 ** 53}}
+    plain = blazon.environment.Environment(name="mixedNative").schema(value)
+    vector = blazon.environment.Environment(name="mixedVector", vectorize=True).schema(value)
+
+    for instance in samples():
+        assert plain.is_valid(list(instance)) == vector.is_valid(list(instance))
+        assert outcome(plain, list(instance)) == outcome(vector, list(instance))
+
+
+def test_vectorized_ndarray():
+    env = blazon.environment.Environment(name="vectorNative", vectorize=True)
+    s = env.schema({"items": {"type": float, "minimum": 0, "maximum": 100}})
+    items = s.constraints["items"]
+
+    assert items.vector.mask(np.linspace(0, 100, 1000)).all()
+    assert s.is_valid(np.linspace(0, 100, 1000))
+    assert not s.is_valid(np.linspace(-1, 100, 1000))
+    assert s.validate(np.linspace(0, 100, 1000))
+    assert s(np.linspace(-1, 100, 1000))[0] == 0
+
+    # Numpy's integers aren't python ints, so they get the usual treatment
+    assert items.vector.mask(np.arange(1000)) is None
+    assert not s.is_valid(np.arange(1000))
+
+
+def test_vectorized_first_failure():
+    s = json_env(vectorize=True).schema(schemas[1])
+    instance = [1.0] * 500 + [0.0, -1.0]
+
+    with pytest.raises(blazon.ValidationError) as exc:
+        s(instance)
+    assert "must be larger than 0" in str(exc.value)